@@ -120,8 +120,7 @@ def _display_rich_results(report):
     cat_table.add_column("Score")
     
     for cat, stats in report.summary.get("by_category", {}).items():
-        total = stats["passed"] + stats["failed"]
-        score = (stats["passed"] / total * 100) if total > 0 else 0
+        score = stats["score"]
         score_str = f"[green]{score:.0f}%[/green]" if score >= 80 else f"[yellow]{score:.0f}%[/yellow]"
         cat_table.add_row(
             cat.capitalize(),
@@ -246,6 +246,36 @@ class SearchEngine:
         if domain is None:
             domain = self._detect_domain(query)
         
+        data, bm25, output_cols = self._build_domain_index(domain)
+        return self._top_results(data, bm25.score(query), output_cols, max_results)
+    
+    def batch_search(self, queries: list[tuple[str, Optional[str], int]]) -> list[list[dict]]:
+        """Run several searches, building each domain's index only once.
+        
+        Args:
+            queries: (query, domain, max_results) tuples; domain None auto-detects
+            
+        Returns:
+            Result lists in the same order as queries, each exactly what
+            search() would return for that query
+        """
+        resolved = [
+            (query, domain if domain is not None else self._detect_domain(query), max_results)
+            for query, domain, max_results in queries
+        ]
+        
+        indexes = {}
+        results = []
+        for query, domain, max_results in resolved:
+            if domain not in indexes:
+                indexes[domain] = self._build_domain_index(domain)
+            data, bm25, output_cols = indexes[domain]
+            results.append(self._top_results(data, bm25.score(query), output_cols, max_results))
+        
+        return results
+    
+    def _build_domain_index(self, domain: str) -> tuple[list[dict], BM25, list[str]]:
+        """Load a domain's rows and fit a BM25 index over its search columns."""
         if domain not in self.CSV_CONFIG:
             raise ValueError(f"Unknown domain: {domain}. Available: {list(self.CSV_CONFIG.keys())}")
         
@@ -266,14 +296,17 @@ class SearchEngine:
         # BM25 search
         bm25 = BM25()
         bm25.fit(documents)
-        ranked = bm25.score(query)
-        
-        # Get top results
+        return data, bm25, config["output_cols"]
+    
+    @staticmethod
+    def _top_results(data: list[dict], ranked: list[tuple[int, float]],
+                     output_cols: list[str], max_results: int) -> list[dict]:
+        """Format the best-scoring rows of a ranked BM25 result."""
         results = []
         for idx, score in ranked[:max_results]:
             if score > 0:
                 row = data[idx]
-                result = {col: row.get(col, "") for col in config["output_cols"]}
+                result = {col: row.get(col, "") for col in output_cols}
                 result["_score"] = round(score, 4)
                 results.append(result)
         
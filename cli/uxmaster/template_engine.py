@@ -10,15 +10,32 @@ Advanced template system supporting:
 - Variables: {{variable_name}}
 """
 
+import os
 import re
+import shutil
 import yaml
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Optional
 from rich.console import Console
 
 console = Console()
 
+# Every tag is found in one scan; the body is classified by its leading token
+_TAG_PATTERN = re.compile(r'\{\{(.*?)\}\}', re.DOTALL)
+_VAR_PATTERN = re.compile(r'\s*([\w.]+)(?:\s*\|\s*(\w+))?\s*')
+_PARTIAL_NAME_PATTERN = re.compile(r'\w+(-\w+)*')
+# Block opener after '#': keyword, any whitespace, then the argument
+_BLOCK_OPEN_PATTERN = re.compile(r'(\w+)\s+(.*)', re.DOTALL)
+_BLOCK_KINDS = frozenset({'if', 'unless', 'each'})
+# Separator runs collapsed by the snake_case / kebab_case filters
+_SNAKE_SEPARATORS = frozenset(' \t\n\r\f\v-')
+_KEBAB_SEPARATORS = frozenset(' \t\n\r\f\v_')
+
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class PlatformConfig:
@@ -60,6 +77,7 @@ class TemplateEngine:
             self.templates_dir = Path(templates_dir)
         
         self._cache: dict[str, str] = {}
+        self._compiled: dict[str, list] = {}
         self._helpers: dict[str, Callable] = {
             'upper': str.upper,
             'lower': str.lower,
@@ -79,24 +97,7 @@ class TemplateEngine:
         - Partials: {{> partial_name}}
         - Comments: {{! comment }}
         """
-        result = template
-        
-        # Remove comments first
-        result = self._remove_comments(result)
-        
-        # Process partials
-        result = self._process_partials(result)
-        
-        # Process conditionals (handle nested)
-        result = self._process_conditionals(result, context)
-        
-        # Process loops
-        result = self._process_loops(result, context)
-        
-        # Process variables
-        result = self._process_variables(result, context)
-        
-        return result
+        return self._render_nodes(self._compile(template), context)
     
     def render_file(self, template_name: str, context: dict[str, Any]) -> str:
         """Render template from file."""
@@ -131,17 +132,14 @@ class TemplateEngine:
         lines = []
         if config.frontmatter:
             lines.append("---")
-            for key, value in config.frontmatter.items():
-                if isinstance(value, list):
-                    lines.append(f"{key}:")
-                    for item in value:
-                        lines.append(f"  - {item}")
-                elif isinstance(value, dict):
-                    lines.append(f"{key}:")
-                    for k, v in value.items():
-                        lines.append(f"  {k}: {v}")
-                else:
-                    lines.append(f"{key}: {value}")
+            lines.append(yaml.dump(
+                config.frontmatter,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+                width=2**31 - 1,
+            ).rstrip())
             lines.append("---")
             lines.append("")
         
@@ -157,131 +155,148 @@ class TemplateEngine:
         
         return "\n".join(lines)
     
-    def _remove_comments(self, template: str) -> str:
-        """Remove template comments."""
-        return re.sub(r'\{\{!.*?\}\}', '', template, flags=re.DOTALL)
+    def _compile(self, template: str) -> list:
+        """Parse a template into a node tree, caching by source text."""
+        nodes = self._compiled.get(template)
+        if nodes is None:
+            nodes = self._parse(template, set())
+            self._compiled[template] = nodes
+        return nodes
     
-    def _process_partials(self, template: str) -> str:
-        """Process partial includes."""
-        pattern = r'\{\{>\s*(\w+(-\w+)*)\s*\}\}'
-        
-        def replace_partial(match: re.Match) -> str:
-            partial_name = match.group(1)
-            try:
-                partial_path = self.templates_dir / "partials" / f"{partial_name}.md"
-                if partial_path.exists():
-                    with open(partial_path, 'r', encoding='utf-8') as f:
-                        return f.read()
-                return f"<!-- Partial '{partial_name}' not found -->"
-            except Exception as e:
-                return f"<!-- Error loading partial '{partial_name}': {e} -->"
+    def _parse(self, template: str, partials_seen: set[str]) -> list:
+        """Build the node tree from a single scan over all template tags.
         
-        return re.sub(pattern, replace_partial, template)
-    
-    def _process_conditionals(self, template: str, context: dict) -> str:
-        """Process conditional blocks."""
-        # Handle {{#if condition}}...{{/if}}
-        def replace_if(match: re.Match) -> str:
-            condition = match.group(1).strip()
-            content = match.group(2)
+        Nodes are plain text strings, ``('var', path, filter, raw)`` tuples and
+        ``[kind, arg, body, else_body, raw]`` block lists.
+        """
+        root: list = []
+        stack: list[list] = []
+        current = root
+        pos = 0
+        
+        for match in _TAG_PATTERN.finditer(template):
+            if match.start() > pos:
+                current.append(template[pos:match.start()])
+            pos = match.end()
+            raw = match.group(0)
+            tag = match.group(1)
+            head = tag[:1]
             
-            # Evaluate condition
-            if self._evaluate_condition(condition, context):
-                return self._process_conditionals(content, context)
-            return ""
-        
-        # Handle {{#unless condition}}...{{/unless}}
-        def replace_unless(match: re.Match) -> str:
-            condition = match.group(1).strip()
-            content = match.group(2)
+            if head == '!':
+                continue
             
-            if not self._evaluate_condition(condition, context):
-                return self._process_conditionals(content, context)
-            return ""
-        
-        # Handle {{#if condition}}...{{else}}...{{/if}}
-        def replace_if_else(match: re.Match) -> str:
-            condition = match.group(1).strip()
-            if_content = match.group(2)
-            else_content = match.group(4) if match.group(4) else ""
+            if head == '>':
+                current.extend(self._parse_partial(tag[1:].strip(), raw, partials_seen))
+                continue
             
-            if self._evaluate_condition(condition, context):
-                return self._process_conditionals(if_content, context)
+            if head == '#':
+                opener = _BLOCK_OPEN_PATTERN.fullmatch(tag, 1)
+                if opener and opener.group(1) in _BLOCK_KINDS and opener.group(2).strip():
+                    block = [opener.group(1), opener.group(2).strip(), [], None, raw]
+                    current.append(block)
+                    stack.append(block)
+                    current = block[2]
+                    continue
+            elif head == '/':
+                kind = tag[1:].strip()
+                if stack and stack[-1][0] == kind:
+                    stack.pop()
+                    current = stack[-1][3 if stack[-1][3] is not None else 2] if stack else root
+                    continue
+            elif tag.strip() == 'else':
+                if stack and stack[-1][0] == 'if' and stack[-1][3] is None:
+                    stack[-1][3] = []
+                    current = stack[-1][3]
+                    continue
             else:
-                return self._process_conditionals(else_content, context)
-        
-        result = template
-        # Process nested if-else first
-        result = re.sub(
-            r'\{\{#if\s+([^}]+)\}\}(.*?)\{\{else\}\}(.*?)\{\{/if\}\}',
-            replace_if_else, result, flags=re.DOTALL
-        )
-        # Then simple if
-        result = re.sub(
-            r'\{\{#if\s+([^}]+)\}\}(.*?)\{\{/if\}\}',
-            replace_if, result, flags=re.DOTALL
-        )
-        # Then unless
-        result = re.sub(
-            r'\{\{#unless\s+([^}]+)\}\}(.*?)\{\{/unless\}\}',
-            replace_unless, result, flags=re.DOTALL
-        )
-        
-        return result
+                var = _VAR_PATTERN.fullmatch(tag)
+                if var:
+                    current.append(('var', var.group(1), var.group(2), raw))
+                    continue
+            
+            # Unrecognised or unbalanced tag: keep it verbatim
+            current.append(raw)
+        
+        if pos < len(template):
+            current.append(template[pos:])
+        
+        # Unclosed blocks fall back to their literal source
+        while stack:
+            block = stack.pop()
+            parent = stack[-1][3 if stack[-1][3] is not None else 2] if stack else root
+            parent.pop()
+            parent.append(block[4])
+            parent.extend(block[2])
+            if block[3] is not None:
+                parent.append('{{else}}')
+                parent.extend(block[3])
+        
+        return root
+    
+    def _parse_partial(self, partial_name: str, raw: str, partials_seen: set[str]) -> list:
+        """Load and parse a partial include."""
+        if not _PARTIAL_NAME_PATTERN.fullmatch(partial_name) or partial_name in partials_seen:
+            return [raw]
+        try:
+            partial_path = self.templates_dir / "partials" / f"{partial_name}.md"
+            if partial_path.exists():
+                with open(partial_path, 'r', encoding='utf-8') as f:
+                    source = f.read()
+                return self._parse(source, partials_seen | {partial_name})
+            return [f"<!-- Partial '{partial_name}' not found -->"]
+        except Exception as e:
+            return [f"<!-- Error loading partial '{partial_name}': {e} -->"]
+    
+    def _render_nodes(self, nodes: list, context: dict) -> str:
+        """Render a compiled node tree against a context."""
+        out: list[str] = []
+        self._render_into(nodes, context, out)
+        return "".join(out)
+    
+    def _render_into(self, nodes: list, context: dict, out: list[str]) -> None:
+        """Append rendered output for nodes to out."""
+        for node in nodes:
+            if isinstance(node, str):
+                out.append(node)
+            elif isinstance(node, tuple):
+                out.append(self._render_variable(node, context))
+            else:
+                kind, arg, body, else_body, _ = node
+                if kind == 'each':
+                    self._render_loop(arg, body, context, out)
+                elif self._evaluate_condition(arg, context) == (kind == 'if'):
+                    self._render_into(body, context, out)
+                elif else_body:
+                    self._render_into(else_body, context, out)
+    
+    def _render_loop(self, list_name: str, body: list, context: dict, out: list[str]) -> None:
+        """Render an each block once per item."""
+        items = self._get_nested_value(context, list_name)
+        if not items:
+            return
+        
+        last = len(items) - 1
+        for i, item in enumerate(items):
+            item_context = {**context, 'this': item, '@index': i, '@first': i == 0, '@last': i == last}
+            self._render_into(body, item_context, out)
     
-    def _process_loops(self, template: str, context: dict) -> str:
-        """Process loop blocks."""
-        pattern = r'\{\{#each\s+(\w+)\}\}(.*?)\{\{/each\}\}'
+    def _render_variable(self, node: tuple, context: dict) -> str:
+        """Render a variable with its optional filter."""
+        _, var_path, filter_name, _ = node
         
-        def replace_loop(match: re.Match) -> str:
-            list_name = match.group(1)
-            content = match.group(2)
-            
-            items = context.get(list_name, [])
-            if not items:
-                return ""
-            
-            results = []
-            for i, item in enumerate(items):
-                item_context = {**context, 'this': item, '@index': i, '@first': i == 0, '@last': i == len(items) - 1}
-                # Handle {{this.property}} or just {{this}}
-                item_content = content
-                if isinstance(item, dict):
-                    for key, value in item.items():
-                        item_content = item_content.replace(f'{{{{this.{key}}}}}', str(value))
-                else:
-                    item_content = item_content.replace('{{this}}', str(item))
-                item_content = self._process_variables(item_content, item_context)
-                results.append(item_content)
-            
-            return "".join(results)
+        # Get value from context (support nested: obj.prop)
+        value = self._get_nested_value(context, var_path)
         
-        return re.sub(pattern, replace_loop, template, flags=re.DOTALL)
-    
-    def _process_variables(self, template: str, context: dict) -> str:
-        """Process variable substitutions with optional filters."""
-        # Pattern: {{variable}} or {{variable | filter}} or {{variable.nested}}
-        pattern = r'\{\{\s*([\w.]+)(?:\s*\|\s*(\w+))?\s*\}\}'
-        
-        def replace_var(match: re.Match) -> str:
-            var_path = match.group(1)
-            filter_name = match.group(2)
-            
-            # Get value from context (support nested: obj.prop)
-            value = self._get_nested_value(context, var_path)
-            
-            if value is None:
-                return f"{{{{{var_path}}}}}"  # Keep original if not found
-            
-            result = str(value)
-            
-            # Apply filter if specified
-            if filter_name and filter_name in self._helpers:
-                result = self._helpers[filter_name](result)
-            
-            return result
+        if value is None:
+            return f"{{{{{var_path}}}}}"  # Keep original if not found
+        
+        result = str(value)
+        
+        # Apply filter if specified
+        if filter_name and filter_name in self._helpers:
+            result = self._helpers[filter_name](result)
         
-        return re.sub(pattern, replace_var, template)
+        return result
     
     def _evaluate_condition(self, condition: str, context: dict) -> bool:
         """Evaluate a condition string."""
@@ -323,19 +338,50 @@ class TemplateEngine:
         
         return value
     
-    def _to_snake_case(self, s: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _to_snake_case(s: str) -> str:
         """Convert string to snake_case."""
+        if s.isascii():
+            return _join_case(s, '_', _SNAKE_SEPARATORS)
         s = re.sub(r'(?<!^)(?=[A-Z])', '_', s).lower()
         s = re.sub(r'[\s-]+', '_', s)
         return s
     
-    def _to_kebab_case(self, s: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _to_kebab_case(s: str) -> str:
         """Convert string to kebab-case."""
+        if s.isascii():
+            return _join_case(s, '-', _KEBAB_SEPARATORS)
         s = re.sub(r'(?<!^)(?=[A-Z])', '-', s).lower()
         s = re.sub(r'[\s_]+', '-', s)
         return s
 
 
+def _join_case(s: str, sep: str, separators: frozenset) -> str:
+    """Regex-free case conversion for ASCII input.
+    
+    Inserts sep before every uppercase letter after the first character and
+    collapses runs of separator characters into a single sep.
+    """
+    parts = []
+    in_run = False
+    for i, ch in enumerate(s):
+        if ch in separators:
+            in_run = True
+            continue
+        if in_run:
+            parts.append(sep)
+            in_run = False
+        if i and 'A' <= ch <= 'Z':
+            parts.append(sep)
+        parts.append(ch)
+    if in_run:
+        parts.append(sep)
+    return ''.join(parts).lower()
+
+
 class PlatformManager:
     """Manages platform configurations and generation."""
     
@@ -360,6 +406,9 @@ class PlatformManager:
         'all': 'all',
     }
     
+    # Concrete platforms, i.e. everything except the 'all' pseudo-target
+    _REAL_PLATFORMS = tuple(k for k in AI_TO_PLATFORM if k != 'all')
+    
     def __init__(self, templates_dir: Optional[Path] = None):
         self.engine = TemplateEngine(templates_dir)
         self.platforms_dir = self.engine.templates_dir / "platforms"
@@ -389,8 +438,7 @@ class PlatformManager:
         
         # Write skill file
         skill_file = skill_dir / config.folder_structure['filename']
-        with open(skill_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        skill_file.write_text(content, encoding='utf-8')
         
         created = [str(skill_file)]
         
@@ -403,9 +451,7 @@ class PlatformManager:
     def generate_all_platforms(self, output_dir: Path) -> list[str]:
         """Generate skill files for all platforms."""
         all_created = []
-        for ai_type in self.AI_TO_PLATFORM.keys():
-            if ai_type == 'all':
-                continue
+        for ai_type in self._REAL_PLATFORMS:
             try:
                 created = self.generate_skill(ai_type, output_dir)
                 all_created.extend(created)
@@ -417,14 +463,12 @@ class PlatformManager:
     def list_supported_platforms(self) -> dict[str, str]:
         """List all supported AI platforms."""
         platforms = {}
-        for ai_type, platform_name in self.AI_TO_PLATFORM.items():
-            if ai_type == 'all':
-                continue
+        for ai_type in self._REAL_PLATFORMS:
             try:
                 config = self.load_platform_config(ai_type)
                 platforms[ai_type] = config.display_name
             except:
-                platforms[ai_type] = platform_name
+                platforms[ai_type] = self.AI_TO_PLATFORM[ai_type]
         
         return platforms
     
@@ -438,21 +482,35 @@ class PlatformManager:
         # Copy data (relative to existing ux-master structure)
         data_source = cli_dir.parent / "data"
         if data_source.exists():
-            import shutil
             data_target = skill_dir / "data"
-            if data_target.exists():
-                shutil.rmtree(data_target)
-            shutil.copytree(data_source, data_target)
+            self._sync_tree(data_source, data_target)
             created.append(str(data_target))
         
         # Copy scripts
         scripts_source = cli_dir.parent / "scripts"
         if scripts_source.exists():
-            import shutil
             scripts_target = skill_dir / "scripts"
-            if scripts_target.exists():
-                shutil.rmtree(scripts_target)
-            shutil.copytree(scripts_source, scripts_target)
+            self._sync_tree(scripts_source, scripts_target)
             created.append(str(scripts_target))
         
         return created
+    
+    @staticmethod
+    def _sync_tree(source: Path, target: Path) -> None:
+        """Mirror a directory tree using hardlinks, copying only across devices.
+        
+        The old target is removed first so files deleted or renamed in the
+        source do not linger; unlinking hardlinks leaves the source intact.
+        """
+        if target.exists():
+            shutil.rmtree(target)
+        shutil.copytree(source, target, copy_function=_link_or_copy)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink src to dst, falling back to a full copy when linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
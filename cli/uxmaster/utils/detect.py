@@ -1,5 +1,6 @@
 """AI assistant detection utilities."""
 
+import os
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -53,26 +54,38 @@ def detect_ai_type() -> Tuple[list[str], Optional[str]]:
         ".factory": "droid",
     }
     
+    present = _list_entries(cwd)
     for folder, ai_type in indicators.items():
-        if (cwd / folder).exists():
+        if folder in present:
             detected.append(ai_type)
             if suggested is None:
                 suggested = ai_type
     
     # Check global configs
-    global_indicators = {
-        home / ".claude": "claude",
-        home / ".cursor": "cursor",
-        home / ".config" / "claude": "claude",
-    }
+    home_entries = _list_entries(home)
+    config_entries = _list_entries(home / ".config") if ".config" in home_entries else set()
+    global_indicators = (
+        (home_entries, ".claude", "claude"),
+        (home_entries, ".cursor", "cursor"),
+        (config_entries, "claude", "claude"),
+    )
     
-    for path, ai_type in global_indicators.items():
-        if path.exists() and ai_type not in detected:
+    for entries, name, ai_type in global_indicators:
+        if name in entries and ai_type not in detected:
             detected.append(ai_type)
     
     return detected, suggested
 
 
+def _list_entries(directory: Path) -> set[str]:
+    """Return the names of all entries in a directory with one scandir call."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
 def get_ai_type_description(ai_type: str) -> str:
     """Get human-readable description for AI type."""
     return AI_DESCRIPTIONS.get(ai_type, ai_type.title())
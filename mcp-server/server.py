@@ -24,166 +24,448 @@ Version: 4.0.0
 """
 
 import json
+import os
 import sys
 import asyncio
+import threading
+from types import MappingProxyType
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+# Requests carry whole token sets on one line; asyncio's 64 KiB default is too small
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_bytes(data: bytes) -> Any:
+    """Parse a JSON request line (orjson errors subclass json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_stdout(data: bytes) -> None:
+    """Write raw bytes to fd 1, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(1, view)
+        view = view[written:]
+
+
+# Shared read-only stand-in for a tool call without arguments
+EMPTY_ARGUMENTS = MappingProxyType({})
+
+# Success envelope pieces; the id and result bytes are spliced in between
+ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+ENVELOPE_RESULT = b',"result":'
+ENVELOPE_SUFFIX = b'}\n'
+
+# Static protocol payloads, serialized once at import
+INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "ux-master-harvester",
+        "version": "4.0.0"
+    }
+}
+
+TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "harvest_url",
+            "description": "Extract complete design system from any website URL. Returns colors, typography, spacing, components, and tokens.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "Website URL to extract design system from"
+                    },
+                    "include_mobile": {
+                        "type": "boolean",
+                        "description": "Also extract mobile viewport design",
+                        "default": True
+                    },
+                    "wait_time": {
+                        "type": "number",
+                        "description": "Seconds to wait for page load",
+                        "default": 3
+                    }
+                },
+                "required": ["url"]
+            }
+        },
+        {
+            "name": "generate_components",
+            "description": "Generate production-ready React/Vue components from design tokens. Supports React+Tailwind, Semi Design, and Vue 3.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "design_tokens": {
+                        "type": "object",
+                        "description": "Design tokens from harvest_url result"
+                    },
+                    "framework": {
+                        "type": "string",
+                        "enum": ["react-tailwind", "semi", "vue"],
+                        "description": "Target framework",
+                        "default": "react-tailwind"
+                    },
+                    "components": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Specific components to generate (button, card, input, etc.)"
+                    }
+                },
+                "required": ["design_tokens"]
+            }
+        },
+        {
+            "name": "export_to_figma",
+            "description": "Export design tokens to Figma Tokens Studio format. Import directly into Figma for design handoff.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "design_tokens": {
+                        "type": "object",
+                        "description": "Design tokens to export"
+                    },
+                    "token_set_name": {
+                        "type": "string",
+                        "description": "Name of the token set in Figma",
+                        "default": "Design System"
+                    }
+                },
+                "required": ["design_tokens"]
+            }
+        },
+        {
+            "name": "create_stitch_prompt",
+            "description": "Create optimized prompt for Google Stitch AI to generate matching designs. Use for quick UI generation based on extracted design system.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "design_tokens": {
+                        "type": "object",
+                        "description": "Design tokens from harvest"
+                    },
+                    "screen_type": {
+                        "type": "string",
+                        "enum": ["dashboard", "landing", "settings", "profile", "checkout"],
+                        "description": "Type of screen to generate"
+                    }
+                },
+                "required": ["design_tokens", "screen_type"]
+            }
+        },
+        {
+            "name": "create_design_md",
+            "description": "Generate DESIGN.md file for Google Stitch based on extracted design system. Creates semantic design documentation.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "design_tokens": {
+                        "type": "object",
+                        "description": "Design tokens"
+                    },
+                    "project_name": {
+                        "type": "string",
+                        "description": "Name of the project"
+                    }
+                },
+                "required": ["design_tokens", "project_name"]
+            }
+        }
+    ]
+}
+
+INITIALIZE_BYTES = dumps_bytes(INITIALIZE_RESULT)
+TOOLS_LIST_BYTES = dumps_bytes(TOOLS_LIST_RESULT)
+
+# DESIGN.md sections; only the header and typography take parameters
+DESIGN_MD_HEADER = """# Design System: {project_name}
+
+## 1. Visual Theme & Atmosphere
+A professional, modern interface with clean aesthetics and thoughtful use of whitespace. 
+The design prioritizes clarity and usability while maintaining visual appeal.
+
+## 2. Color Palette & Roles
+"""
+
+DESIGN_MD_TYPOGRAPHY = """
+## 3. Typography Rules
+
+**Font Family**: {font_family}
+- Clean, modern sans-serif for optimal readability
+- Use system font stack for performance
+
+**Type Scale**:
+- Base: {base_size}
+- Headings: Bold weight (600-700)
+- Body: Regular weight (400)
+- Line Height: 1.5 for readability
+"""
+
+DESIGN_MD_COMPONENT_STYLINGS = """
+## 4. Component Stylings
+
+**Buttons:**
+- Primary: Solid fill with primary color, white text
+- Secondary: Outlined with border, transparent background
+- Border Radius: 6px (medium)
+- Padding: 12px 24px (base spacing)
+- Hover: Slight darken of background
+
+**Cards:**
+- Background: White or bg-1
+- Border Radius: 12px (large)
+- Shadow: Elevated (0 4px 14px rgba(0,0,0,0.1))
+- Padding: 24px
+
+**Inputs:**
+- Border: 1px solid neutral-200
+- Border Radius: 6px
+- Focus: Primary color border
+- Padding: 12px 16px
+"""
+
+DESIGN_MD_LAYOUT_PRINCIPLES = """
+## 5. Layout Principles
+- 8px grid system for consistent spacing
+- Max content width: 1200px
+- Generous whitespace (breathing room)
+- Clear visual hierarchy
+- Mobile-first responsive design
+"""
+
+NEUTRAL_SCALE_KEYS = ("neutral-50",) + tuple(f"neutral-{i}" for i in range(100, 1000, 100))
+
+# Static scaffolding for Stitch prompts
+STITCH_VISUAL_STYLE_LINES = (
+    "",
+    "## Visual Style",
+    "- Modern, clean interface",
+    "- Consistent spacing with 8px grid system",
+    "- Accessible color contrast (WCAG AA)",
+    "- Professional, business-ready aesthetic",
+    "",
+    "## Screen Requirements",
+)
+
+STITCH_SCREEN_REQUIREMENTS = {
+    "dashboard": (
+        "- Header with navigation and user profile",
+        "- Key metrics cards in grid layout",
+        "- Data visualization section",
+        "- Recent activity list",
+        "- Quick action buttons",
+    ),
+    "landing": (
+        "- Hero section with headline and CTA",
+        "- Feature highlights in 3-column grid",
+        "- Social proof section",
+        "- Pricing section",
+        "- Footer with navigation",
+    ),
+    "settings": (
+        "- Sidebar navigation for settings categories",
+        "- Form inputs for user preferences",
+        "- Toggle switches for features",
+        "- Save and cancel buttons",
+        "- Section dividers",
+    ),
+    "profile": (
+        "- Profile header with avatar and name",
+        "- User stats cards",
+        "- Activity timeline",
+        "- Edit profile button",
+        "- Tab navigation for sections",
+    ),
+}
+
+STITCH_DEFAULT_REQUIREMENTS = ("- Main content area",)
+
+STITCH_GUIDELINE_LINES = (
+    "",
+    "Design Guidelines:",
+    "- Use the primary color for main actions",
+    "- Maintain consistent spacing (16px, 24px, 32px)",
+    "- Include hover states for interactive elements",
+    "- Ensure mobile responsiveness",
+    "- Add subtle shadows for depth (elevated cards)",
+)
+
+# Figma token type by name fragment, checked in order after the colour test
+FIGMA_NAME_TYPES = (
+    ("font-size", "fontSizes"),
+    ("font-family", "fontFamilies"),
+    ("spacing", "spacing"),
+    ("radius", "borderRadius"),
+)
+
+
+def figma_token_type(name: str, value: Any) -> str:
+    """Classify a non-colour-category token for Figma Tokens Studio."""
+    text = value if isinstance(value, str) else str(value)
+    if "bg-" in text or "text-" in text:
+        return "color"
+    for fragment, token_type in FIGMA_NAME_TYPES:
+        if fragment in name:
+            return token_type
+    return "other"
+
+
+SEMANTIC_COLOR_NAMES = ("success", "warning", "danger", "info")
+
+
+def base_color(value: Any, default: str = "") -> Any:
+    """Unwrap a color scale ({"base": ...}) to its base value."""
+    if isinstance(value, dict):
+        return value.get("base", default)
+    return value
+
+
+# Generated sources are returned as previews of at most this many characters
+FILE_PREVIEW_CHARS = 500
+
+
+def preview_files(files: Dict[str, str]) -> Dict[str, str]:
+    """Truncate long file bodies, reusing the dict when nothing needs cutting."""
+    if all(len(v) <= FILE_PREVIEW_CHARS for v in files.values()):
+        return files
+    return {
+        k: v[:FILE_PREVIEW_CHARS] + "..." if len(v) > FILE_PREVIEW_CHARS else v
+        for k, v in files.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def browser_harvester_module():
+    """Import harvester_browser once (it pulls in Playwright)."""
+    import harvester_browser
+    return harvester_browser
+
+
+@lru_cache(maxsize=None)
+def component_generator_class():
+    """Import ComponentGenerator once."""
+    from component_generator import ComponentGenerator
+    return ComponentGenerator
+
+
+def warm_imports():
+    """Resolve the heavy tool modules ahead of the first call."""
+    for loader in (browser_harvester_module, component_generator_class):
+        try:
+            loader()
+        except Exception as e:
+            MCPLogger.error(f"Preload failed for {loader.__name__}: {e}")
+
 
 class MCPLogger:
-    """Log to stderr (stdout reserved for MCP protocol)."""
+    """Log to stderr (stdout reserved for MCP protocol).
+    
+    Each message is a single os.write on fd 2, bypassing the text wrapper.
+    """
     @staticmethod
     def info(msg: str):
-        print(f"[INFO] {msg}", file=sys.stderr)
+        os.write(2, b"[INFO] %s\n" % msg.encode("utf-8", "replace"))
     
     @staticmethod
     def error(msg: str):
-        print(f"[ERROR] {msg}", file=sys.stderr)
+        os.write(2, b"[ERROR] %s\n" % msg.encode("utf-8", "replace"))
 
 
 class HarvesterMCPServer:
     """MCP Server for UX Master Harvester v4."""
     
+    __slots__ = ("logger", "_tool_handlers", "_send_queue")
+    
     def __init__(self):
         self.logger = MCPLogger()
+        # Response frames waiting for the end-of-tick flush
+        self._send_queue: List[bytes] = []
+        # tool name -> (is_async, bound handler), classified once
+        self._tool_handlers = {
+            name: (asyncio.iscoroutinefunction(handler), handler)
+            for name, handler in (
+                ("harvest_url", self.handle_harvest_url),
+                ("generate_components", self.handle_generate_components),
+                ("export_to_figma", self.handle_export_to_figma),
+                ("create_stitch_prompt", self.handle_create_stitch_prompt),
+                ("create_design_md", self.handle_create_design_md),
+            )
+        }
+        
+    def send_response(self, req_id: Any, result: Any, error: Optional[str] = None):
+        """Send JSON-RPC response.
         
-    def send_response(self, result: Any, error: Optional[str] = None):
-        """Send JSON-RPC response."""
+        Each response is queued as one complete frame, so responses are
+        never interleaved even when several tool calls are in flight.
+        """
+        if not error:
+            self.send_result_bytes(req_id, dumps_bytes(result))
+            return
         response = {
             "jsonrpc": "2.0",
-            "result": result if error is None else None,
-            "error": {"code": -32000, "message": error} if error else None
+            "id": req_id,
+            "error": {"code": -32000, "message": error}
         }
-        print(json.dumps(response), flush=True)
+        self._queue_frame(dumps_bytes(response) + b"\n")
+    
+    def send_result_bytes(self, req_id: Any, payload: bytes):
+        """Send a success response whose result is already serialized JSON."""
+        self._queue_frame(b"".join((
+            ENVELOPE_PREFIX, dumps_bytes(req_id), ENVELOPE_RESULT, payload, ENVELOPE_SUFFIX
+        )))
+    
+    def _queue_frame(self, frame: bytes):
+        """Queue a response frame for the end of the current loop tick.
+        
+        Tool calls finishing in the same tick share one write; outside an
+        event loop the frame is written immediately.
+        """
+        self._send_queue.append(frame)
+        if len(self._send_queue) == 1:
+            try:
+                asyncio.get_running_loop().call_soon(self.flush)
+            except RuntimeError:
+                self.flush()
+    
+    def flush(self):
+        """Write all queued response frames to stdout."""
+        if self._send_queue:
+            data = b"".join(self._send_queue)
+            self._send_queue.clear()
+            write_stdout(data)
     
     def handle_initialize(self, params: Dict) -> Dict:
         """Handle initialize request."""
-        return {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {
-                "tools": {}
-            },
-            "serverInfo": {
-                "name": "ux-master-harvester",
-                "version": "4.0.0"
-            }
-        }
+        return INITIALIZE_RESULT
     
     def handle_tools_list(self) -> Dict:
         """List available tools."""
-        return {
-            "tools": [
-                {
-                    "name": "harvest_url",
-                    "description": "Extract complete design system from any website URL. Returns colors, typography, spacing, components, and tokens.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "url": {
-                                "type": "string",
-                                "description": "Website URL to extract design system from"
-                            },
-                            "include_mobile": {
-                                "type": "boolean",
-                                "description": "Also extract mobile viewport design",
-                                "default": True
-                            },
-                            "wait_time": {
-                                "type": "number",
-                                "description": "Seconds to wait for page load",
-                                "default": 3
-                            }
-                        },
-                        "required": ["url"]
-                    }
-                },
-                {
-                    "name": "generate_components",
-                    "description": "Generate production-ready React/Vue components from design tokens. Supports React+Tailwind, Semi Design, and Vue 3.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "design_tokens": {
-                                "type": "object",
-                                "description": "Design tokens from harvest_url result"
-                            },
-                            "framework": {
-                                "type": "string",
-                                "enum": ["react-tailwind", "semi", "vue"],
-                                "description": "Target framework",
-                                "default": "react-tailwind"
-                            },
-                            "components": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Specific components to generate (button, card, input, etc.)"
-                            }
-                        },
-                        "required": ["design_tokens"]
-                    }
-                },
-                {
-                    "name": "export_to_figma",
-                    "description": "Export design tokens to Figma Tokens Studio format. Import directly into Figma for design handoff.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "design_tokens": {
-                                "type": "object",
-                                "description": "Design tokens to export"
-                            },
-                            "token_set_name": {
-                                "type": "string",
-                                "description": "Name of the token set in Figma",
-                                "default": "Design System"
-                            }
-                        },
-                        "required": ["design_tokens"]
-                    }
-                },
-                {
-                    "name": "create_stitch_prompt",
-                    "description": "Create optimized prompt for Google Stitch AI to generate matching designs. Use for quick UI generation based on extracted design system.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "design_tokens": {
-                                "type": "object",
-                                "description": "Design tokens from harvest"
-                            },
-                            "screen_type": {
-                                "type": "string",
-                                "enum": ["dashboard", "landing", "settings", "profile", "checkout"],
-                                "description": "Type of screen to generate"
-                            }
-                        },
-                        "required": ["design_tokens", "screen_type"]
-                    }
-                },
-                {
-                    "name": "create_design_md",
-                    "description": "Generate DESIGN.md file for Google Stitch based on extracted design system. Creates semantic design documentation.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "design_tokens": {
-                                "type": "object",
-                                "description": "Design tokens"
-                            },
-                            "project_name": {
-                                "type": "string",
-                                "description": "Name of the project"
-                            }
-                        },
-                        "required": ["design_tokens", "project_name"]
-                    }
-                }
-            ]
-        }
+        return TOOLS_LIST_RESULT
     
     async def handle_harvest_url(self, params: Dict) -> Dict:
         """Harvest design system from URL."""
@@ -194,7 +476,8 @@ class HarvesterMCPServer:
         self.logger.info(f"Harvesting: {url}")
         
         try:
-            from harvester_browser import BrowserHarvester, HarvestConfig
+            hb = browser_harvester_module()
+            BrowserHarvester, HarvestConfig = hb.BrowserHarvester, hb.HarvestConfig
             
             config = HarvestConfig(
                 url=url,
@@ -213,8 +496,7 @@ class HarvesterMCPServer:
                 result = results[0]
                 
                 # Build design system
-                from harvester_browser import DesignSystemBuilder
-                builder = DesignSystemBuilder(results, config.output_dir)
+                builder = hb.DesignSystemBuilder(results, config.output_dir)
                 ds_meta = builder.build()
                 
                 return {
@@ -245,7 +527,7 @@ class HarvesterMCPServer:
         self.logger.info(f"Generating {framework} components")
         
         try:
-            from component_generator import ComponentGenerator
+            ComponentGenerator = component_generator_class()
             
             # Create mock design system structure
             design_system = {
@@ -274,8 +556,7 @@ class HarvesterMCPServer:
                 "framework": framework,
                 "components_generated": len(generated),
                 "files": {
-                    name: {k: v[:500] + "..." if len(v) > 500 else v 
-                           for k, v in files.items()}
+                    name: preview_files(files)
                     for name, files in generated.items()
                 }
             }
@@ -290,40 +571,27 @@ class HarvesterMCPServer:
         
         self.logger.info(f"Exporting to Figma: {token_set_name}")
         
+        # Convert tokens to Figma format in a single comprehension; colour
+        # categories are tested once per category, not per token
+        token_set = {
+            f"{category}/{name}": {
+                "value": value,
+                "type": "color" if color_category else figma_token_type(name, value)
+            }
+            for category, values in tokens.items() if isinstance(values, dict)
+            for color_category in ("color" in category,)
+            for name, value in values.items()
+        }
         figma_tokens = {
             "_version": "1.0",
-            token_set_name: {}
+            token_set_name: token_set
         }
         
-        # Convert tokens to Figma format
-        for category, values in tokens.items():
-            if isinstance(values, dict):
-                for name, value in values.items():
-                    key = f"{category}/{name}"
-                    
-                    if "color" in category or "bg-" in str(value) or "text-" in str(value):
-                        token_type = "color"
-                    elif "font-size" in name:
-                        token_type = "fontSizes"
-                    elif "font-family" in name:
-                        token_type = "fontFamilies"
-                    elif "spacing" in name:
-                        token_type = "spacing"
-                    elif "radius" in name:
-                        token_type = "borderRadius"
-                    else:
-                        token_type = "other"
-                    
-                    figma_tokens[token_set_name][key] = {
-                        "value": value,
-                        "type": token_type
-                    }
-        
         return {
             "success": True,
             "format": "figma-tokens",
             "token_set": token_set_name,
-            "token_count": len(figma_tokens[token_set_name]),
+            "token_count": len(token_set),
             "tokens": figma_tokens,
             "instructions": "Copy the tokens object into Figma Tokens Studio plugin"
         }
@@ -345,86 +613,33 @@ class HarvesterMCPServer:
         
         # Add primary colors
         if "primary" in colors:
-            primary = colors["primary"]
-            if isinstance(primary, dict):
-                primary = primary.get("base", "#0064FA")
+            primary = base_color(colors["primary"], "#0064FA")
             prompt_parts.append(f"- Primary: {primary} (Use for main CTAs and highlights)")
         
         # Add semantic colors
-        for name in ["success", "warning", "danger", "info"]:
-            if name in colors:
-                val = colors[name]
-                if isinstance(val, dict):
-                    val = val.get("base", "")
-                if val:
-                    prompt_parts.append(f"- {name.capitalize()}: {val}")
+        for name in SEMANTIC_COLOR_NAMES:
+            val = base_color(colors.get(name))
+            if val:
+                prompt_parts.append(f"- {name.capitalize()}: {val}")
         
-        # Add neutrals
-        prompt_parts.extend([
-            "",
-            "## Typography",
-            f"- Font Family: {typography.get('font-family-regular', 'Inter, sans-serif')}",
-            f"- Base Size: {typography.get('font-size-regular', '14px')}",
-            "",
-            "## Visual Style",
-            "- Modern, clean interface",
-            "- Consistent spacing with 8px grid system",
-            "- Accessible color contrast (WCAG AA)",
-            "- Professional, business-ready aesthetic",
-            "",
-            f"## Screen Requirements",
-            f"Design a {screen_type} screen that includes:",
-        ])
+        # Add typography
+        prompt_parts.append("")
+        prompt_parts.append("## Typography")
+        prompt_parts.append(f"- Font Family: {typography.get('font-family-regular', 'Inter, sans-serif')}")
+        prompt_parts.append(f"- Base Size: {typography.get('font-size-regular', '14px')}")
+        prompt_parts.extend(STITCH_VISUAL_STYLE_LINES)
+        prompt_parts.append(f"Design a {screen_type} screen that includes:")
         
         # Add screen-specific requirements
-        screen_requirements = {
-            "dashboard": [
-                "- Header with navigation and user profile",
-                "- Key metrics cards in grid layout",
-                "- Data visualization section",
-                "- Recent activity list",
-                "- Quick action buttons"
-            ],
-            "landing": [
-                "- Hero section with headline and CTA",
-                "- Feature highlights in 3-column grid",
-                "- Social proof section",
-                "- Pricing section",
-                "- Footer with navigation"
-            ],
-            "settings": [
-                "- Sidebar navigation for settings categories",
-                "- Form inputs for user preferences",
-                "- Toggle switches for features",
-                "- Save and cancel buttons",
-                "- Section dividers"
-            ],
-            "profile": [
-                "- Profile header with avatar and name",
-                "- User stats cards",
-                "- Activity timeline",
-                "- Edit profile button",
-                "- Tab navigation for sections"
-            ]
-        }
-        
-        prompt_parts.extend(screen_requirements.get(screen_type, ["- Main content area"]))
-        
-        prompt_parts.extend([
-            "",
-            "Design Guidelines:",
-            "- Use the primary color for main actions",
-            "- Maintain consistent spacing (16px, 24px, 32px)",
-            "- Include hover states for interactive elements",
-            "- Ensure mobile responsiveness",
-            "- Add subtle shadows for depth (elevated cards)"
-        ])
+        prompt_parts.extend(STITCH_SCREEN_REQUIREMENTS.get(screen_type, STITCH_DEFAULT_REQUIREMENTS))
+        prompt_parts.extend(STITCH_GUIDELINE_LINES)
         
+        prompt = "\n".join(prompt_parts)
         return {
             "success": True,
             "screen_type": screen_type,
-            "prompt": "\n".join(prompt_parts),
-            "word_count": len(" ".join(prompt_parts).split()),
+            "prompt": prompt,
+            "word_count": len(prompt.split()),
             "tips": [
                 "Paste this prompt directly into Google Stitch",
                 "Adjust based on specific requirements",
@@ -440,78 +655,32 @@ class HarvesterMCPServer:
         colors = tokens.get("color", {})
         typography = tokens.get("typography", {})
         
-        design_md = f"""# Design System: {project_name}
-
-## 1. Visual Theme & Atmosphere
-A professional, modern interface with clean aesthetics and thoughtful use of whitespace. 
-The design prioritizes clarity and usability while maintaining visual appeal.
-
-## 2. Color Palette & Roles
-"""
+        parts = [DESIGN_MD_HEADER.format(project_name=project_name)]
         
         # Add colors
         if "primary" in colors:
-            primary = colors["primary"]
-            if isinstance(primary, dict):
-                primary = primary.get("base", "")
-            design_md += f"\n**Primary Action** ({primary})\n"
-            design_md += f"- Hex: {primary}\n"
-            design_md += "- Usage: Main CTAs, primary buttons, links, active states\n"
-            design_md += "- Psychology: Professional, trustworthy, actionable\n"
+            primary = base_color(colors["primary"])
+            parts.append(
+                f"\n**Primary Action** ({primary})\n"
+                f"- Hex: {primary}\n"
+                "- Usage: Main CTAs, primary buttons, links, active states\n"
+                "- Psychology: Professional, trustworthy, actionable\n"
+            )
         
         # Neutrals
-        design_md += "\n**Neutral Scale**\n"
-        for i in range(0, 1000, 100):
-            key = f"neutral-{i}" if i > 0 else "neutral-50"
+        parts.append("\n**Neutral Scale**\n")
+        for key in NEUTRAL_SCALE_KEYS:
             if key in colors:
-                design_md += f"- {key}: {colors[key]}\n"
+                parts.append(f"- {key}: {colors[key]}\n")
         
         # Typography
-        design_md += """
-## 3. Typography Rules
-"""
-        font_family = typography.get("font-family-regular", "Inter, sans-serif")
-        design_md += f"""
-**Font Family**: {font_family}
-- Clean, modern sans-serif for optimal readability
-- Use system font stack for performance
-
-**Type Scale**:
-- Base: {typography.get('font-size-regular', '14px')}
-- Headings: Bold weight (600-700)
-- Body: Regular weight (400)
-- Line Height: 1.5 for readability
-"""
-        
-        design_md += """
-## 4. Component Stylings
-
-**Buttons:**
-- Primary: Solid fill with primary color, white text
-- Secondary: Outlined with border, transparent background
-- Border Radius: 6px (medium)
-- Padding: 12px 24px (base spacing)
-- Hover: Slight darken of background
-
-**Cards:**
-- Background: White or bg-1
-- Border Radius: 12px (large)
-- Shadow: Elevated (0 4px 14px rgba(0,0,0,0.1))
-- Padding: 24px
-
-**Inputs:**
-- Border: 1px solid neutral-200
-- Border Radius: 6px
-- Focus: Primary color border
-- Padding: 12px 16px
-
-## 5. Layout Principles
-- 8px grid system for consistent spacing
-- Max content width: 1200px
-- Generous whitespace (breathing room)
-- Clear visual hierarchy
-- Mobile-first responsive design
-"""
+        parts.append(DESIGN_MD_TYPOGRAPHY.format(
+            font_family=typography.get("font-family-regular", "Inter, sans-serif"),
+            base_size=typography.get("font-size-regular", "14px"),
+        ))
+        parts.append(DESIGN_MD_COMPONENT_STYLINGS)
+        parts.append(DESIGN_MD_LAYOUT_PRINCIPLES)
+        design_md = "".join(parts)
         
         return {
             "success": True,
@@ -527,68 +696,127 @@ The design prioritizes clarity and usability while maintaining visual appeal.
     
     async def handle_tool_call(self, tool_name: str, params: Dict) -> Dict:
         """Route tool calls to handlers."""
-        handlers = {
-            "harvest_url": self.handle_harvest_url,
-            "generate_components": lambda p: self.handle_generate_components(p),
-            "export_to_figma": lambda p: self.handle_export_to_figma(p),
-            "create_stitch_prompt": lambda p: self.handle_create_stitch_prompt(p),
-            "create_design_md": lambda p: self.handle_create_design_md(p),
-        }
-        
-        handler = handlers.get(tool_name)
-        if handler:
-            if asyncio.iscoroutinefunction(handler):
-                return await handler(params)
-            return handler(params)
-        
-        return {"error": f"Unknown tool: {tool_name}"}
+        try:
+            is_async, handler = self._tool_handlers[tool_name]
+        except KeyError:
+            return {"error": f"Unknown tool: {tool_name}"}
+        return await handler(params) if is_async else handler(params)
+    
+    async def _dispatch_and_respond(self, req_id: Any, tool_name: str, params: Dict):
+        """Run one tool call and write its response."""
+        try:
+            result = await self.handle_tool_call(tool_name, params)
+            self.send_response(req_id, result)
+        except Exception as e:
+            self.logger.error(f"Error: {e}")
+            self.send_response(req_id, None, str(e))
     
-    async def run(self):
-        """Main server loop."""
+    async def run(self, reader: Optional[asyncio.StreamReader] = None):
+        """Main server loop.
+        
+        Tool calls are dispatched as tasks so a slow harvest does not block
+        reading (and answering) the requests that follow it.
+        """
         self.logger.info("UX Master MCP Server starting...")
         
+        if reader is None:
+            reader = await open_stdin_reader()
+        pending: set = set()
+        
+        # Import tool modules in the background so the first call doesn't pay for it
+        asyncio.get_running_loop().run_in_executor(None, warm_imports)
+        
         while True:
             try:
-                line = input()
-                if not line:
-                    continue
-                
-                request = json.loads(line)
-                method = request.get("method")
+                line = await reader.readline()
+            except ValueError as e:
+                # Line longer than MAX_REQUEST_BYTES; the reader has discarded it
+                self.logger.error(f"Request too large: {e}")
+                continue
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            
+            # Every request is a JSON object; reject other frames without parsing
+            if line[0] != 0x7B or line[-1] != 0x7D:  # b"{", b"}"
+                self.logger.error("Bad frame: expected a JSON object")
+                continue
+            try:
+                request = loads_bytes(line)
+            except json.JSONDecodeError as e:
+                self.logger.error(f"JSON decode error: {e}")
+                continue
+            
+            req_id = request.get("id")
+            method = request.get("method")
+            try:
                 params = request.get("params", {})
-                req_id = request.get("id")
                 
                 if method == "initialize":
-                    result = self.handle_initialize(params)
-                    self.send_response(result)
+                    self.send_result_bytes(req_id, INITIALIZE_BYTES)
                     
                 elif method == "tools/list":
-                    result = self.handle_tools_list()
-                    self.send_response(result)
+                    self.send_result_bytes(req_id, TOOLS_LIST_BYTES)
                     
                 elif method == "tools/call":
                     tool_name = params.get("name")
-                    tool_params = params.get("arguments", {})
-                    result = await self.handle_tool_call(tool_name, tool_params)
-                    self.send_response(result)
+                    tool_params = params.get("arguments") or EMPTY_ARGUMENTS
+                    task = asyncio.create_task(
+                        self._dispatch_and_respond(req_id, tool_name, tool_params)
+                    )
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
                     
                 elif method == "shutdown":
-                    self.send_response(None)
-                    break
+                    if pending:
+                        await asyncio.gather(*pending)
+                    self.send_response(req_id, None)
+                    self.flush()
+                    return
                     
-            except EOFError:
-                break
-            except json.JSONDecodeError as e:
-                self.logger.error(f"JSON decode error: {e}")
             except Exception as e:
                 self.logger.error(f"Error: {e}")
-                self.send_response(None, str(e))
+                self.send_response(req_id, None, str(e))
+        
+        # EOF: let in-flight tool calls finish before exiting
+        if pending:
+            await asyncio.gather(*pending)
+        self.flush()
+
+
+async def open_stdin_reader() -> asyncio.StreamReader:
+    """Expose stdin as an asyncio StreamReader.
+    
+    Pipes are attached to the event loop directly. Where that is not
+    supported (Windows proactor loop, stdin redirected from a file), a
+    daemon thread feeds the reader instead.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_REQUEST_BYTES)
+    protocol = asyncio.StreamReaderProtocol(reader)
+    try:
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+    except (NotImplementedError, ValueError, OSError):
+        def pump():
+            for chunk in iter(sys.stdin.buffer.readline, b""):
+                loop.call_soon_threadsafe(reader.feed_data, chunk)
+            loop.call_soon_threadsafe(reader.feed_eof)
+        
+        threading.Thread(target=pump, daemon=True).start()
+    return reader
 
 
 async def main():
     """Entry point."""
+    # fd 1 belongs to the protocol writer; route stray print() calls from
+    # tool modules to stderr so they can't land between response frames
+    sys.stdout = sys.stderr
+    
     server = HarvesterMCPServer()
-    await server.run()
+    reader = await open_stdin_reader()
+    await server.run(reader)
 
 
 if __name__ == "__main__":
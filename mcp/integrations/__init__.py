@@ -1,5 +1,11 @@
 """MCP integrations for UX-Master."""
 
+import sys
+from pathlib import Path
+
+# Shared helpers (canonical_json) live with the validation engine in scripts/
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
 from .figma import FigmaClient, FigmaError
 from .stitch import StitchClient, StitchExporter
 
@@ -9,11 +9,68 @@ Features:
 """
 
 import os
+import sys
 import json
+import hashlib
+import asyncio
+import threading
 from typing import Optional
 from dataclasses import dataclass
 
 import httpx
+from validation_engine import canonical_json
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Variable type names, interned once so every generated variable shares them
+COLOR_TYPE = sys.intern("COLOR")
+FLOAT_TYPE = sys.intern("FLOAT")
+
+# Token groups turned into Figma variables, in output order:
+# (token key, nested key or None, name prefix, variable type, description label)
+TOKEN_CATEGORIES = (
+    ("colors", None, "color/", COLOR_TYPE, "color"),
+    ("spacing", None, "spacing/", FLOAT_TYPE, "spacing"),
+    ("typography", "sizes", "font-size/", FLOAT_TYPE, "font size"),
+    ("borderRadius", None, "border-radius/", FLOAT_TYPE, "border radius"),
+)
+
+# Collection previews shared by all clients, keyed by etag; the MCP server
+# opens a client per export, so a per-client cache would never hit.
+# Oldest entries are evicted first
+COLLECTION_CACHE_SIZE = 32
+_COLLECTION_CACHE: dict[str, dict] = {}
+_COLLECTION_CACHE_LOCK = threading.Lock()
+
+# Requests one client may have in flight, and attempts per request on HTTP 429
+MAX_CONCURRENT_REQUESTS = 16
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Variables per POST when bulk-creating, and how many batches may be in flight
+DEFAULT_BATCH_SIZE = 500
+MAX_PARALLEL_BATCHES = 8
+
+# Channel byte -> Figma unit float, rounded as the API payload expects
+BYTE_TO_UNIT = tuple(round(i / 255, 4) for i in range(256))
+
+# Below this many colors the per-color path beats NumPy's setup cost
+BULK_COLOR_THRESHOLD = 32
 
 
 class FigmaError(Exception):
@@ -46,33 +103,83 @@ class FigmaClient:
             raise FigmaError("Figma token required. Set FIGMA_TOKEN environment variable.")
         
         self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=30
+            ),
             headers={"X-Figma-Token": self.token},
-            timeout=30.0
+            timeout=httpx.Timeout(30.0, connect=5.0)
         )
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
     async def close(self):
         """Close HTTP client."""
         await self.client.aclose()
     
-    async def get_file(self, file_key: str) -> dict:
-        """Get file information."""
-        response = await self.client.get(f"{self.BASE_URL}/files/{file_key}")
+    async def _request(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        """Send a request under the client's concurrency limit.
         
-        if response.status_code != 200:
-            raise FigmaError(f"Failed to get file: {response.text}")
+        Rate-limited (429) responses are retried, waiting for Figma's
+        Retry-After header or exponential backoff when it is absent.
+        With stream=True the body is left unread and the caller must close
+        the response.
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            request = self.client.build_request(method, url, **kwargs)
+            async with self._sem:
+                response = await self.client.send(request, stream=stream)
+            if response.status_code != 429:
+                return response
+            if stream and attempt < MAX_RATE_LIMIT_RETRIES - 1:
+                await response.aclose()
+            if attempt < MAX_RATE_LIMIT_RETRIES - 1:
+                await asyncio.sleep(self._retry_delay(response, attempt))
+        return response
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        try:
+            return max(0.0, float(response.headers["Retry-After"]))
+        except (KeyError, ValueError):
+            return float(2 ** attempt)
+    
+    async def _get_json(self, url: str, error_message: str) -> dict:
+        """GET a JSON document, streaming the raw body straight into the parser.
         
-        return response.json()
+        Skips httpx's decode-to-str step, which matters for multi-megabyte
+        Figma file payloads.
+        """
+        response = await self._request("GET", url, stream=True)
+        try:
+            if response.status_code != 200:
+                await response.aread()
+                raise FigmaError(f"{error_message}: {response.text}")
+            
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+        finally:
+            await response.aclose()
+        
+        if ORJSON_AVAILABLE:
+            return orjson.loads(body)
+        return json.loads(body)
+    
+    async def get_file(self, file_key: str) -> dict:
+        """Get file information."""
+        return await self._get_json(
+            f"{self.BASE_URL}/files/{file_key}", "Failed to get file"
+        )
     
     async def get_variables(self, file_key: str) -> dict:
         """Get all variables in a file."""
-        response = await self.client.get(
-            f"{self.BASE_URL}/files/{file_key}/variables/local"
+        return await self._get_json(
+            f"{self.BASE_URL}/files/{file_key}/variables/local",
+            "Failed to get variables"
         )
-        
-        if response.status_code != 200:
-            raise FigmaError(f"Failed to get variables: {response.text}")
-        
-        return response.json()
     
     async def create_variable_collection(
         self,
@@ -107,8 +214,45 @@ class FigmaClient:
         Returns:
             API response
         """
-        # Convert UXM tokens to Figma format
+        figma_variables = self._serialize_variables(collection_id, variables)
+        return await self._post_variables(file_key, figma_variables)
+    
+    async def bulk_create_variables(
+        self,
+        file_key: str,
+        collection_id: str,
+        variables: list[FigmaVariable],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[dict]:
+        """Create many variables in batched POSTs sent concurrently.
+        
+        Args:
+            file_key: Figma file key
+            collection_id: Variable collection ID
+            variables: List of variables to create
+            batch_size: Maximum variables per request
+            
+        Returns:
+            API responses, one per batch
+        """
+        figma_variables = self._serialize_variables(collection_id, variables)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_BATCHES)
+        
+        async def post_batch(batch: list[dict]) -> dict:
+            async with semaphore:
+                return await self._post_variables(file_key, batch)
+        
+        return await asyncio.gather(*(
+            post_batch(figma_variables[start:start + batch_size])
+            for start in range(0, len(figma_variables), batch_size)
+        ))
+    
+    def _serialize_variables(self, collection_id: str, variables: list[FigmaVariable]) -> list[dict]:
+        """Convert UXM variables to Figma API payload entries."""
         figma_variables = []
+        color_values = iter(self._convert_colors_bulk(
+            [var.value for var in variables if var.type == COLOR_TYPE]
+        ))
         
         for var in variables:
             figma_var = {
@@ -121,18 +265,21 @@ class FigmaClient:
                 figma_var["description"] = var.description
             
             # Add value based on type
-            if var.type == "COLOR":
-                figma_var["value"] = self._convert_color(var.value)
-            elif var.type == "FLOAT":
+            if var.type == COLOR_TYPE:
+                figma_var["value"] = next(color_values)
+            elif var.type == FLOAT_TYPE:
                 figma_var["value"] = float(var.value)
             else:
                 figma_var["value"] = var.value
             
             figma_variables.append(figma_var)
         
-        # POST to Figma API
-        response = await self.client.post(
-            f"{self.BASE_URL}/files/{file_key}/variables",
+        return figma_variables
+    
+    async def _post_variables(self, file_key: str, figma_variables: list[dict]) -> dict:
+        """POST one batch of serialized variables to the Figma API."""
+        response = await self._request(
+            "POST", f"{self.BASE_URL}/files/{file_key}/variables",
             json={"variables": figma_variables}
         )
         
@@ -155,14 +302,25 @@ class FigmaClient:
             collection_name: Name for the variable collection
             
         Returns:
-            Created variables info
+            Created variables info, with an "etag" identifying the inputs.
+            Repeat calls with identical inputs return the same cached dict,
+            which must not be mutated.
         """
+        etag = hashlib.blake2b(
+            canonical_json([file_key, collection_name, tokens]),
+            digest_size=16
+        ).hexdigest()
+        with _COLLECTION_CACHE_LOCK:
+            cached = _COLLECTION_CACHE.get(etag)
+        if cached is not None:
+            return cached
+        
         # Convert tokens to Figma variables
         variables = self._tokens_to_variables(tokens)
         
         # For now, return what would be created
         # Full implementation requires Figma API support for collection creation
-        return {
+        result = {
             "status": "success",
             "file_key": file_key,
             "collection_name": collection_name,
@@ -171,56 +329,36 @@ class FigmaClient:
                 {"name": v.name, "type": v.type, "value": v.value}
                 for v in variables[:10]  # Preview first 10
             ],
-            "note": "Manual step required: Create variable collection in Figma UI"
+            "note": "Manual step required: Create variable collection in Figma UI",
+            "etag": etag
         }
+        
+        with _COLLECTION_CACHE_LOCK:
+            if etag not in _COLLECTION_CACHE and len(_COLLECTION_CACHE) >= COLLECTION_CACHE_SIZE:
+                _COLLECTION_CACHE.pop(next(iter(_COLLECTION_CACHE)))
+            _COLLECTION_CACHE[etag] = result
+        return result
     
     def _tokens_to_variables(self, tokens: dict) -> list[FigmaVariable]:
         """Convert UX-Master tokens to Figma variables."""
         variables = []
         
-        # Process colors
-        if "colors" in tokens:
-            colors = tokens["colors"]
-            for role, value in colors.items():
-                if isinstance(value, str) and value.startswith("#"):
-                    variables.append(FigmaVariable(
-                        name=f"color/{role}",
-                        type="COLOR",
-                        value=value,
-                        description=f"{role} color"
-                    ))
-        
-        # Process spacing
-        if "spacing" in tokens:
-            spacing = tokens["spacing"]
-            for name, value in spacing.items():
-                variables.append(FigmaVariable(
-                    name=f"spacing/{name}",
-                    type="FLOAT",
-                    value=value,
-                    description=f"{name} spacing"
-                ))
-        
-        # Process typography sizes
-        if "typography" in tokens:
-            typography = tokens["typography"]
-            if "sizes" in typography:
-                for name, value in typography["sizes"].items():
-                    variables.append(FigmaVariable(
-                        name=f"font-size/{name}",
-                        type="FLOAT",
-                        value=value,
-                        description=f"{name} font size"
-                    ))
-        
-        # Process border radius
-        if "borderRadius" in tokens:
-            for name, value in tokens["borderRadius"].items():
+        for key, subkey, prefix, var_type, label in TOKEN_CATEGORIES:
+            source = tokens.get(key)
+            if source and subkey:
+                source = source.get(subkey)
+            if not source:
+                continue
+            
+            for name, value in source.items():
+                # Colors only carry hex values
+                if var_type is COLOR_TYPE and not (isinstance(value, str) and value.startswith("#")):
+                    continue
                 variables.append(FigmaVariable(
-                    name=f"border-radius/{name}",
-                    type="FLOAT",
+                    name=f"{prefix}{name}",
+                    type=var_type,
                     value=value,
-                    description=f"{name} border radius"
+                    description=f"{name} {label}"
                 ))
         
         return variables
@@ -230,26 +368,50 @@ class FigmaClient:
         hex_color = hex_color.lstrip("#")
         
         if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16) / 255
-            g = int(hex_color[2:4], 16) / 255
-            b = int(hex_color[4:6], 16) / 255
-            a = 1
-        elif len(hex_color) == 8:
-            r = int(hex_color[0:2], 16) / 255
-            g = int(hex_color[2:4], 16) / 255
-            b = int(hex_color[4:6], 16) / 255
-            a = int(hex_color[6:8], 16) / 255
-        else:
-            # Invalid hex, return black
-            r = g = b = 0
-            a = 1
+            n = int(hex_color, 16)
+            return {
+                "r": BYTE_TO_UNIT[n >> 16],
+                "g": BYTE_TO_UNIT[(n >> 8) & 0xFF],
+                "b": BYTE_TO_UNIT[n & 0xFF],
+                "a": 1
+            }
+        if len(hex_color) == 8:
+            n = int(hex_color, 16)
+            return {
+                "r": BYTE_TO_UNIT[n >> 24],
+                "g": BYTE_TO_UNIT[(n >> 16) & 0xFF],
+                "b": BYTE_TO_UNIT[(n >> 8) & 0xFF],
+                "a": BYTE_TO_UNIT[n & 0xFF]
+            }
         
-        return {
-            "r": round(r, 4),
-            "g": round(g, 4),
-            "b": round(b, 4),
-            "a": round(a, 4)
-        }
+        # Invalid hex, return black
+        return {"r": 0, "g": 0, "b": 0, "a": 1}
+    
+    def _convert_colors_bulk(self, hex_colors: list[str]) -> list[dict]:
+        """Convert many hex colors, vectorized with NumPy for large palettes.
+        
+        Produces exactly what _convert_color would for each entry.
+        """
+        if not NUMPY_AVAILABLE or len(hex_colors) < BULK_COLOR_THRESHOLD:
+            return [self._convert_color(c) for c in hex_colors]
+        
+        stripped = [c.lstrip("#") for c in hex_colors]
+        valid = [i for i, h in enumerate(stripped) if len(h) in (6, 8)]
+        
+        # Pad RGB to RGBA so every color is 4 bytes, then map bytes through
+        # the same rounding table the scalar path uses
+        packed = bytes.fromhex("".join(
+            stripped[i] if len(stripped[i]) == 8 else stripped[i] + "ff" for i in valid
+        ))
+        units = np.asarray(BYTE_TO_UNIT)[
+            np.frombuffer(packed, dtype=np.uint8).reshape(-1, 4)
+        ].tolist()
+        
+        # Invalid hex, black
+        results = [{"r": 0, "g": 0, "b": 0, "a": 1} for _ in stripped]
+        for i, (r, g, b, a) in zip(valid, units):
+            results[i] = {"r": r, "g": g, "b": b, "a": a if len(stripped[i]) == 8 else 1}
+        return results
     
     async def export_styles_to_tokens(self, file_key: str) -> dict:
         """Export Figma styles to design tokens format."""
@@ -275,19 +437,42 @@ class FigmaClient:
         return tokens
 
 
-# Sync client for synchronous usage
+# Sync client for synchronous usage. Every FigmaClientSync shares one
+# pooled connection so repeat calls skip the TCP/TLS handshake; the token
+# travels per request so instances with different tokens can share it.
+_SYNC_CLIENT: Optional[httpx.Client] = None
+_SYNC_CLIENT_LOCK = threading.Lock()
+
+
+def _get_sync_client() -> httpx.Client:
+    """Return the process-wide sync HTTP client, creating it on first use."""
+    global _SYNC_CLIENT
+    with _SYNC_CLIENT_LOCK:
+        if _SYNC_CLIENT is None or _SYNC_CLIENT.is_closed:
+            _SYNC_CLIENT = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=16,
+                    keepalive_expiry=60
+                ),
+                timeout=30.0
+            )
+        return _SYNC_CLIENT
+
+
 class FigmaClientSync:
     """Synchronous Figma client."""
     
     def __init__(self, token: Optional[str] = None):
         self.token = token or os.getenv("FIGMA_TOKEN")
-        self.client = httpx.Client(
-            headers={"X-Figma-Token": self.token},
-            timeout=30.0
-        )
+        self.client = _get_sync_client()
+        self._headers = {"X-Figma-Token": self.token}
     
     def get_file(self, file_key: str) -> dict:
         """Get file information."""
-        response = self.client.get(f"https://api.figma.com/v1/files/{file_key}")
+        response = self.client.get(
+            f"https://api.figma.com/v1/files/{file_key}",
+            headers=self._headers
+        )
         response.raise_for_status()
         return response.json()
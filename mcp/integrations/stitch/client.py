@@ -12,11 +12,92 @@ Features:
 - Sync design systems between UX-Master and Stitch
 """
 
+import re
+import sys
 import json
+import hashlib
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from validation_engine import canonical_json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Token type tags, interned once so every generated token shares them
+COLOR_TOKEN_TYPE = sys.intern("color")
+TYPOGRAPHY_TOKEN_TYPE = sys.intern("typography")
+
+# Typography scale: (name, size, weight, line height, uses heading font)
+TYPOGRAPHY_SCALE = (
+    ("heading-xl", "48px", "700", "1.2", True),
+    ("heading-lg", "36px", "700", "1.2", True),
+    ("heading-md", "24px", "600", "1.3", True),
+    ("heading-sm", "20px", "600", "1.3", True),
+    ("body-lg", "18px", "400", "1.6", False),
+    ("body-md", "16px", "400", "1.6", False),
+    ("body-sm", "14px", "400", "1.5", False),
+    ("caption", "12px", "400", "1.4", False),
+)
+
+# Style effect keywords that map to Stitch effect tokens
+EFFECT_KEYWORD_PATTERN = re.compile(r"shadow|glass|blur")
+
+# Exports kept per StitchClient; oldest entries are evicted first
+EXPORT_CACHE_SIZE = 32
+
+# System prompt; filled with the style name, key colors and fonts
+SYSTEM_PROMPT_TEMPLATE = """You are an expert UI designer creating a {style_name} interface.
+
+DESIGN SYSTEM:
+- Style: {style_name}
+- Primary Color: {primary}
+- CTA Color: {cta}
+- Background: {background}
+- Heading Font: {heading_font}
+- Body Font: {body_font}
+
+APPLY THESE UX PRINCIPLES:
+- Fitts's Law: All interactive elements must be at least 44x44px
+- Hick's Law: Limit choices to reduce cognitive load
+- Visual Hierarchy: Clear distinction between headings and body text
+- Consistency: Use the design system tokens throughout
+
+Generate clean, modern UI with proper spacing and accessibility."""
+
+# Component prompts; only the button and input prompts depend on colors
+BUTTON_PROMPT_TEMPLATE = """Create buttons with:
+- Primary: Background {primary}, white text, rounded corners
+- CTA: Background {cta}, white text, prominent placement
+- Min height: 44px for touch targets
+- Hover: Subtle opacity change (0.9)
+- Focus: Visible ring for accessibility"""
+
+CARD_PROMPT = """Create cards with:
+- Background: White or light shade
+- Border radius: 8-12px
+- Shadow: Subtle elevation (0 2px 4px rgba(0,0,0,0.1))
+- Padding: 16-24px
+- Hover: Slight elevation increase"""
+
+INPUT_PROMPT_TEMPLATE = """Create form inputs with:
+- Border: 1px solid neutral gray
+- Border radius: 6-8px
+- Padding: 12px 16px
+- Focus: Border color {primary} with ring
+- Error: Red border with helpful message"""
+
+NAVIGATION_PROMPT = """Create navigation with:
+- Clear hierarchy: Logo > Primary Nav > CTAs
+- Mobile: Hamburger menu with proper touch targets
+- Active state: Clear visual indicator
+- Accessibility: Keyboard navigable"""
+
 
 @dataclass
 class StitchColorToken:
@@ -51,23 +132,23 @@ class StitchDesignSystem:
     """Complete Stitch design system."""
     version: str = "1.0"
     name: str = "UX-Master Design System"
-    colors: list = None
-    typography: list = None
-    spacing: list = None
-    effects: list = None
-    components: list = None
+    colors: list = field(default_factory=list)
+    typography: list = field(default_factory=list)
+    spacing: list = field(default_factory=list)
+    effects: list = field(default_factory=list)
+    components: list = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.colors is None:
-            self.colors = []
-        if self.typography is None:
-            self.typography = []
-        if self.spacing is None:
-            self.spacing = []
-        if self.effects is None:
-            self.effects = []
-        if self.components is None:
-            self.components = []
+    def to_dict(self) -> dict:
+        """Plain-dict form, equivalent to asdict() without the deep copy."""
+        return {
+            "version": self.version,
+            "name": self.name,
+            "colors": list(self.colors),
+            "typography": list(self.typography),
+            "spacing": list(self.spacing),
+            "effects": list(self.effects),
+            "components": list(self.components),
+        }
 
 
 class StitchExporter:
@@ -85,6 +166,9 @@ class StitchExporter:
         Returns:
             Stitch-compatible design system dict
         """
+        # Each export starts from an empty design system
+        self.design_system = StitchDesignSystem()
+        
         # Set name if provided
         if "project_name" in uxm_design_system:
             self.design_system.name = uxm_design_system["project_name"]
@@ -102,10 +186,10 @@ class StitchExporter:
             self._convert_style(uxm_design_system["style"])
         
         # Generate Stitch-optimized prompts
-        prompts = self._generate_prompts(uxm_design_system)
+        prompts = self.build_prompts(uxm_design_system)
         
         return {
-            "design_system": asdict(self.design_system),
+            "design_system": self.design_system.to_dict(),
             "stitch_prompts": prompts,
             "metadata": {
                 "source": "ux-master",
@@ -130,54 +214,47 @@ class StitchExporter:
         for key, value in colors.items():
             if isinstance(value, str):
                 name, desc = color_mapping.get(key, (key.title(), f"{key} color"))
-                token = StitchColorToken(
-                    name=name,
-                    value=value,
-                    description=desc
-                )
-                self.design_system.colors.append(asdict(token))
+                # Same layout as StitchColorToken, built directly
+                self.design_system.colors.append({
+                    "name": name,
+                    "value": value,
+                    "type": COLOR_TOKEN_TYPE,
+                    "description": desc
+                })
     
     def _convert_typography(self, typography: dict):
         """Convert UX-Master typography to Stitch tokens."""
         heading_font = typography.get("heading", "Inter")
         body_font = typography.get("body", "Inter")
         
-        # Create typography scale
-        sizes = [
-            ("heading-xl", "48px", "700", "1.2"),
-            ("heading-lg", "36px", "700", "1.2"),
-            ("heading-md", "24px", "600", "1.3"),
-            ("heading-sm", "20px", "600", "1.3"),
-            ("body-lg", "18px", "400", "1.6"),
-            ("body-md", "16px", "400", "1.6"),
-            ("body-sm", "14px", "400", "1.5"),
-            ("caption", "12px", "400", "1.4"),
+        # Same layout as StitchTypographyToken, built directly
+        self.design_system.typography = [
+            {
+                "name": name,
+                "font_family": heading_font if is_heading else body_font,
+                "font_size": size,
+                "font_weight": weight,
+                "line_height": line_height,
+                "type": TYPOGRAPHY_TOKEN_TYPE
+            }
+            for name, size, weight, line_height, is_heading in TYPOGRAPHY_SCALE
         ]
-        
-        for name, size, weight, line_height in sizes:
-            token = StitchTypographyToken(
-                name=name,
-                font_family=heading_font if "heading" in name else body_font,
-                font_size=size,
-                font_weight=weight,
-                line_height=line_height
-            )
-            self.design_system.typography.append(asdict(token))
     
     def _convert_style(self, style: dict):
         """Convert style information to Stitch effects."""
         effects = []
         
         if "effects" in style:
-            effects_str = style["effects"]
-            # Parse effects string for keywords
-            if "shadow" in effects_str.lower():
+            # One scan for every keyword; substring matches, so
+            # "glassmorphism" and "shadows" still count
+            keywords = set(EFFECT_KEYWORD_PATTERN.findall(style["effects"].lower()))
+            if "shadow" in keywords:
                 effects.append({
                     "name": "card-shadow",
                     "type": "box-shadow",
                     "value": "0 4px 6px rgba(0,0,0,0.1)"
                 })
-            if "glass" in effects_str.lower() or "blur" in effects_str.lower():
+            if "glass" in keywords or "blur" in keywords:
                 effects.append({
                     "name": "glass-effect",
                     "type": "backdrop-filter",
@@ -186,6 +263,17 @@ class StitchExporter:
         
         self.design_system.effects = effects
     
+    def build_prompts(self, uxm_ds: dict) -> dict:
+        """Generate the Stitch prompts alone, skipping token conversion.
+        
+        Args:
+            uxm_ds: UX-Master design system
+            
+        Returns:
+            Dict with system_prompt, component_prompts and ux_constraints
+        """
+        return self._generate_prompts(uxm_ds)
+    
     def _generate_prompts(self, uxm_ds: dict) -> dict:
         """Generate Stitch-optimized prompts with UX Laws."""
         prompts = {
@@ -201,25 +289,14 @@ class StitchExporter:
         colors = uxm_ds.get("colors", {})
         typography = uxm_ds.get("typography", {})
         
-        prompt = f"""You are an expert UI designer creating a {style_name} interface.
-
-DESIGN SYSTEM:
-- Style: {style_name}
-- Primary Color: {colors.get('primary', '#2563EB')}
-- CTA Color: {colors.get('cta', '#F97316')}
-- Background: {colors.get('background', '#F8FAFC')}
-- Heading Font: {typography.get('heading', 'Inter')}
-- Body Font: {typography.get('body', 'Inter')}
-
-APPLY THESE UX PRINCIPLES:
-- Fitts's Law: All interactive elements must be at least 44x44px
-- Hick's Law: Limit choices to reduce cognitive load
-- Visual Hierarchy: Clear distinction between headings and body text
-- Consistency: Use the design system tokens throughout
-
-Generate clean, modern UI with proper spacing and accessibility."""
-        
-        return prompt.strip()
+        return SYSTEM_PROMPT_TEMPLATE.format(
+            style_name=style_name,
+            primary=colors.get('primary', '#2563EB'),
+            cta=colors.get('cta', '#F97316'),
+            background=colors.get('background', '#F8FAFC'),
+            heading_font=typography.get('heading', 'Inter'),
+            body_font=typography.get('body', 'Inter')
+        )
     
     def _generate_component_prompts(self, uxm_ds: dict) -> dict:
         """Generate component-specific prompts."""
@@ -228,32 +305,10 @@ Generate clean, modern UI with proper spacing and accessibility."""
         cta = colors.get('cta', '#F97316')
         
         return {
-            "button": f"""Create buttons with:
-- Primary: Background {primary}, white text, rounded corners
-- CTA: Background {cta}, white text, prominent placement
-- Min height: 44px for touch targets
-- Hover: Subtle opacity change (0.9)
-- Focus: Visible ring for accessibility""",
-            
-            "card": f"""Create cards with:
-- Background: White or light shade
-- Border radius: 8-12px
-- Shadow: Subtle elevation (0 2px 4px rgba(0,0,0,0.1))
-- Padding: 16-24px
-- Hover: Slight elevation increase""",
-            
-            "input": f"""Create form inputs with:
-- Border: 1px solid neutral gray
-- Border radius: 6-8px
-- Padding: 12px 16px
-- Focus: Border color {primary} with ring
-- Error: Red border with helpful message""",
-            
-            "navigation": """Create navigation with:
-- Clear hierarchy: Logo > Primary Nav > CTAs
-- Mobile: Hamburger menu with proper touch targets
-- Active state: Clear visual indicator
-- Accessibility: Keyboard navigable"""
+            "button": BUTTON_PROMPT_TEMPLATE.format(primary=primary, cta=cta),
+            "card": CARD_PROMPT,
+            "input": INPUT_PROMPT_TEMPLATE.format(primary=primary),
+            "navigation": NAVIGATION_PROMPT
         }
     
     def _extract_ux_constraints(self, uxm_ds: dict) -> list:
@@ -273,8 +328,17 @@ Generate clean, modern UI with proper spacing and accessibility."""
     
     def save_to_file(self, output_path: Path, data: dict):
         """Save Stitch export to JSON file."""
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+                ))
+            return
+        
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
 
 
 class StitchClient:
@@ -288,6 +352,24 @@ class StitchClient:
         """
         self.api_key = api_key
         self.exporter = StitchExporter()
+        self._export_cache: dict[bytes, dict] = {}
+    
+    def _cached_export(self, design_system: dict) -> dict:
+        """Export a design system, reusing the result for identical input.
+        
+        The returned dict is shared between calls and must not be mutated.
+        """
+        key = hashlib.blake2b(
+            canonical_json(design_system),
+            digest_size=16
+        ).digest()
+        cached = self._export_cache.get(key)
+        if cached is None:
+            cached = self.exporter.export_from_uxm(design_system)
+            if len(self._export_cache) >= EXPORT_CACHE_SIZE:
+                self._export_cache.pop(next(iter(self._export_cache)))
+            self._export_cache[key] = cached
+        return cached
     
     def prepare_for_stitch(self, design_system: dict) -> dict:
         """Prepare UX-Master design system for Stitch.
@@ -298,7 +380,7 @@ class StitchClient:
         Returns:
             Stitch-compatible format
         """
-        return self.exporter.export_from_uxm(design_system)
+        return self._cached_export(design_system)
     
     def generate_stitch_prompt(self, component_type: str, design_system: dict) -> str:
         """Generate a Stitch-optimized prompt for a component.
@@ -310,8 +392,7 @@ class StitchClient:
         Returns:
             Stitch prompt string
         """
-        stitch_data = self.exporter.export_from_uxm(design_system)
-        prompts = stitch_data.get("stitch_prompts", {})
+        prompts = self.exporter.build_prompts(design_system)
         
         # Get component-specific prompt
         component_prompts = prompts.get("component_prompts", {})
@@ -327,22 +408,18 @@ class StitchClient:
         Returns:
             Function that takes a prompt and returns enhanced prompt
         """
-        stitch_data = self.exporter.export_from_uxm(design_system)
-        ux_constraints = stitch_data.get("stitch_prompts", {}).get("ux_constraints", [])
+        # Only critical constraints reach the prompt; format them once here
+        # rather than on every call of the returned function
+        critical_lines = [
+            f"- CRITICAL: {constraint.get('law')} - {constraint.get('application')}"
+            for constraint in self.exporter._extract_ux_constraints(design_system)
+            if constraint.get("severity") == "Critical"
+        ]
+        requirements = "\n\nUX REQUIREMENTS:\n" + "\n".join(critical_lines) if critical_lines else ""
         
         def enhance_prompt(base_prompt: str) -> str:
             """Enhance a prompt with UX constraints."""
-            enhancements = []
-            
-            for constraint in ux_constraints:
-                if constraint.get("severity") == "Critical":
-                    enhancements.append(f"- CRITICAL: {constraint.get('law')} - {constraint.get('application')}")
-            
-            if enhancements:
-                enhanced = base_prompt + "\n\nUX REQUIREMENTS:\n" + "\n".join(enhancements)
-                return enhanced
-            
-            return base_prompt
+            return base_prompt + requirements
         
         return enhance_prompt
 
@@ -365,6 +442,10 @@ def convert_to_stitch_format(uxm_tokens: dict) -> str:
         "project_name": uxm_tokens.get("project_name", "UX-Master Design System")
     })
     
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            stitch_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
     return json.dumps(stitch_data, indent=2)
 
 
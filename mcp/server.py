@@ -12,24 +12,101 @@ Environment Variables:
     FIGMA_TOKEN - Figma API access token
     PORT - Server port (default: 3000)
     HOST - Server host (default: 0.0.0.0)
+    WORKERS - Server worker processes (default: 1). Each worker is a separate
+              process with its own search engine, search result cache and
+              headless Chromium harvester pool, so memory grows roughly by
+              one full server (plus one browser) per worker, and caches
+              are not shared between workers.
 """
 
 import os
+import re
 import json
+import asyncio
+import hashlib
+import importlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from urllib.parse import urlsplit
+from typing import Any, Iterator, Optional
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-# Import UX-Master modules
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# UX-Master modules are imported on first use, not at server start;
+# the paths are added once here rather than on every tool call
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "cli"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+
+def encode_json(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson's C encoder when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            # Values orjson rejects (e.g. ints past 64 bits) still encode below
+            pass
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def get_search_engine():
+    """Import and build the SearchEngine on first use."""
+    from uxmaster.search_engine import SearchEngine
+    return SearchEngine()
+
+
+@lru_cache(maxsize=1)
+def get_validation_engine():
+    """Import and build the ValidationEngine on first use.
+    
+    Its design tests are stateless, so one engine serves every call.
+    """
+    from validation_engine import ValidationEngine
+    return ValidationEngine()
+
+
+@lru_cache(maxsize=1)
+def get_platform_manager():
+    """Import and build the PlatformManager on first use."""
+    from uxmaster.template_engine import PlatformManager
+    return PlatformManager()
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """Whether an optional UX-Master module imports cleanly; probed once.
+    
+    A failed import is not cached by Python, so without this probe every
+    call would re-run the broken module before falling back.
+    """
+    try:
+        importlib.import_module(name)
+    except Exception:
+        return False
+    return True
+
 
-from uxmaster.search_engine import SearchEngine
-from uxmaster.template_engine import PlatformManager
+@lru_cache(maxsize=1)
+def browser_harvester_available() -> bool:
+    """Whether harvester_browser and its playwright backend are usable."""
+    if not module_available("harvester_browser"):
+        return False
+    return importlib.import_module("harvester_browser").PLAYWRIGHT_AVAILABLE
 
 
 # ============================================================================
@@ -71,61 +148,489 @@ class ResourceDefinition(BaseModel):
 # Tool Input Models
 # ============================================================================
 
-class SearchUXLawsInput(BaseModel):
+class ToolInput(BaseModel):
+    """Base for tool inputs; validated once per call and never mutated."""
+    model_config = ConfigDict(frozen=True)
+
+
+class SearchUXLawsInput(ToolInput):
     """Input for search_ux_laws tool."""
     query: str = Field(..., description="Search query for UX Laws")
     product_type: Optional[str] = Field(None, description="Product type filter (mobile, dashboard, landing, etc.)")
     max_results: int = Field(5, ge=1, le=10, description="Maximum results to return")
 
 
-class SearchDesignTestsInput(BaseModel):
+class SearchDesignTestsInput(ToolInput):
     """Input for search_design_tests tool."""
     query: str = Field(..., description="Search query for Design Tests")
     target: Optional[str] = Field(None, description="Target component (mobile, landing, dashboard, etc.)")
     max_results: int = Field(5, ge=1, le=10)
 
 
-class ValidateDesignInput(BaseModel):
+class ValidateDesignInput(ToolInput):
     """Input for validate_design tool."""
     html: str = Field(..., description="HTML content to validate")
     css: Optional[str] = Field(None, description="Optional CSS content")
     test_suite: str = Field("all", description="Test suite to run (all, mobile, landing, dashboard, a11y)")
 
 
-class ExtractDesignSystemInput(BaseModel):
-    """Input for extract_design_system tool."""
-    url: str = Field(..., description="Website URL to extract design system from")
-    depth: int = Field(1, ge=1, le=3, description="Crawl depth")
-    include_screenshots: bool = Field(False, description="Include screenshots")
+class ExtractDesignSystemInput(ToolInput):
+    """Input for extract_design_system tool.
+    
+    The shared harvester renders exactly the given page without
+    screenshots, so crawl options are rejected rather than ignored.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    url: str = Field(..., description="Website URL to extract design system from (single page)")
 
 
-class GenerateDesignSystemInput(BaseModel):
+class GenerateDesignSystemInput(ToolInput):
     """Input for generate_design_system tool."""
     query: str = Field(..., description="Description of what you're building")
     project_name: Optional[str] = Field(None, description="Project name")
     output_format: str = Field("json", description="Output format (json, markdown)")
 
 
-class SearchDomainInput(BaseModel):
+class SearchDomainInput(ToolInput):
     """Input for search_domain tool."""
     query: str = Field(..., description="Search query")
     domain: str = Field(..., description="Domain to search (style, color, typography, ux-laws, etc.)")
     max_results: int = Field(3, ge=1, le=10)
 
 
-class ExportToFigmaInput(BaseModel):
+class ExportToFigmaInput(ToolInput):
     """Input for export_to_figma tool."""
     file_key: str = Field(..., description="Figma file key")
     design_tokens: dict = Field(..., description="Design tokens to export")
     collection_name: str = Field("UX-Master Tokens", description="Variable collection name")
 
 
-class GetStackGuidelinesInput(BaseModel):
+class GetStackGuidelinesInput(ToolInput):
     """Input for get_stack_guidelines tool."""
     query: str = Field(..., description="What you need guidelines for")
     stack: str = Field(..., description="Technology stack (react, nextjs, vue, html-tailwind, etc.)")
 
 
+# Validators built once at import; handlers validate raw params through these
+TOOL_INPUT_ADAPTERS: dict[str, TypeAdapter] = {
+    "search_ux_laws": TypeAdapter(SearchUXLawsInput),
+    "search_design_tests": TypeAdapter(SearchDesignTestsInput),
+    "validate_design": TypeAdapter(ValidateDesignInput),
+    "extract_design_system": TypeAdapter(ExtractDesignSystemInput),
+    "generate_design_system": TypeAdapter(GenerateDesignSystemInput),
+    "search_domain": TypeAdapter(SearchDomainInput),
+    "export_to_figma": TypeAdapter(ExportToFigmaInput),
+    "get_stack_guidelines": TypeAdapter(GetStackGuidelinesInput)
+}
+
+
+# ============================================================================
+# Search Result Cache
+# ============================================================================
+
+# Distinct (tool, target, query, max_results) searches kept in memory
+SEARCH_CACHE_SIZE = 1024
+
+
+class SearchResultCache:
+    """Thread-safe LRU of search result rows.
+    
+    Queries are keyed lowercased with whitespace collapsed; BM25
+    tokenization ignores both, so such variants share one entry. The
+    knowledge base is static CSV, so entries only leave by eviction or
+    clear().
+    """
+    
+    def __init__(self, maxsize: int = SEARCH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, list[dict]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(kind: str, target: Optional[str], query: str, max_results: int) -> tuple:
+        """Cache key for one search."""
+        return (kind, target, " ".join(query.lower().split()), max_results)
+    
+    def get(self, key: tuple) -> Optional[list[dict]]:
+        """Return a copy of the cached rows, or None on a miss."""
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                return None
+            self._entries.move_to_end(key)
+            return list(rows)
+    
+    def put(self, key: tuple, rows: list[dict]) -> None:
+        """Store rows, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = list(rows)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> int:
+        """Drop every entry; returns how many there were."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+
+# ============================================================================
+# Search Batching
+# ============================================================================
+
+class MicroBatcher:
+    """Base for queues that group concurrent awaits into batched dispatches.
+    
+    Callers await _submit(item); a worker task on the caller's event loop
+    collects queued items until max_batch are waiting or max_wait seconds
+    have passed since the first, then hands the batch of (item, future)
+    pairs to _dispatch, which must resolve every future. If _dispatch
+    raises, the callers it left unresolved receive that exception and the
+    worker carries on with the next batch.
+    """
+    
+    def __init__(self, max_batch: int, max_wait: float, queue_size: int = 0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def _submit(self, item: Any) -> Any:
+        """Queue one item and wait for the result _dispatch gives it."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            queue = asyncio.Queue(self.queue_size)
+            # Keep callers still queued behind a worker that stopped
+            if self._queue is not None:
+                while not self._queue.empty():
+                    pending = self._queue.get_nowait()
+                    if not pending[1].done() and pending[1].get_loop() is loop:
+                        queue.put_nowait(pending)
+            self._queue = queue
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def _run(self):
+        """Collect queued items into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._handle(batch)
+    
+    async def _handle(self, batch: list) -> None:
+        """Dispatch one batch, failing its callers if _dispatch raises."""
+        try:
+            await self._dispatch(batch)
+        except Exception as e:
+            self._fail(batch, e)
+    
+    async def _dispatch(self, batch: list) -> None:
+        """Process one batch of (item, future) pairs."""
+        raise NotImplementedError
+    
+    @staticmethod
+    def _fail(batch: list, error: BaseException) -> None:
+        """Raise error in every caller of the batch that is still waiting."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    def _stop(self) -> None:
+        """Cancel the worker; the next submit starts a new one."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+
+# Search calls arriving within this window share one dispatch
+SEARCH_BATCH_MAX_SIZE = 16
+SEARCH_BATCH_MAX_WAIT = 0.02
+SEARCH_BATCH_QUEUE_SIZE = 128
+
+
+class SearchBatcher(MicroBatcher):
+    """Groups concurrent search tool calls into one SearchEngine.batch_search.
+    
+    Each domain's BM25 index is then built once per batch instead of once
+    per call. A batch closes when it is full or SEARCH_BATCH_MAX_WAIT after
+    its first query, so a lone caller waits at most that long.
+    """
+    
+    def __init__(
+        self,
+        max_batch: int = SEARCH_BATCH_MAX_SIZE,
+        max_wait: float = SEARCH_BATCH_MAX_WAIT,
+        queue_size: int = SEARCH_BATCH_QUEUE_SIZE
+    ):
+        super().__init__(max_batch, max_wait, queue_size)
+    
+    async def search(self, query: str, domain: Optional[str], max_results: int) -> list[dict]:
+        """Queue one search and wait for its results."""
+        return await self._submit((query, domain, max_results))
+    
+    async def _dispatch(self, batch: list) -> None:
+        """Run a batch off the event loop and resolve each caller's future."""
+        queries = [query for query, _ in batch]
+        try:
+            engine = get_search_engine()
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        try:
+            results = await asyncio.to_thread(engine.batch_search, queries)
+        except Exception:
+            # One bad query (unknown domain, missing file) fails the whole
+            # batch; rerun individually so only its own caller sees the error
+            for query, future in batch:
+                try:
+                    result = await asyncio.to_thread(engine.search, *query)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Pages the shared browser harvester renders at once, across all batches
+HARVESTER_MAX_PAGES = 4
+
+# Concurrent extract_design_system harvests are grouped into batches of at
+# most this many URLs, collected for at most this many seconds
+HARVEST_BATCH_MAX_SIZE = 8
+HARVEST_BATCH_MAX_WAIT = 0.05
+
+
+class HarvesterPool(MicroBatcher):
+    """One warm BrowserHarvester shared by extract_design_system calls.
+    
+    Chromium is launched by the first harvest instead of on every call and
+    then kept open. Concurrent harvests are queued and grouped into
+    batches; duplicate URLs in a batch are harvested once. Each batch runs
+    as its own task, so a batch still rendering does not hold back the
+    next one, and pages of all batches share one limit of max_pages. The
+    browser belongs to the event loop that launched it; close() stops it.
+    """
+    
+    def __init__(
+        self,
+        max_pages: int = HARVESTER_MAX_PAGES,
+        max_batch: int = HARVEST_BATCH_MAX_SIZE,
+        max_wait: float = HARVEST_BATCH_MAX_WAIT
+    ):
+        super().__init__(max_batch, max_wait)
+        self.max_pages = max_pages
+        self._harvester = None
+        # Loop-bound primitives, created with the browser
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._pages: Optional[asyncio.Semaphore] = None
+        self._batches: set[asyncio.Task] = set()
+    
+    async def harvest(self, url: str) -> dict:
+        """Queue one URL and wait for its harvested data."""
+        result = await self._submit(url)
+        if not result.success:
+            raise RuntimeError(result.error or "Unknown error")
+        return result.data or {}
+    
+    async def _handle(self, batch: list) -> None:
+        """Run the batch as its own task and return to collecting the next."""
+        async def run():
+            try:
+                await MicroBatcher._handle(self, batch)
+            finally:
+                # Only reached with callers left on cancellation by close()
+                self._fail(batch, RuntimeError("Harvester pool closed"))
+        
+        task = asyncio.get_running_loop().create_task(run())
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _dispatch(self, batch: list) -> None:
+        """Harvest a batch in the shared browser and resolve each caller's future."""
+        urls = list(dict.fromkeys(url for url, _ in batch))
+        harvester = await self._start()
+        results = await asyncio.gather(
+            *(self._harvest_page(harvester, url) for url in urls),
+            return_exceptions=True
+        )
+        
+        by_url = dict(zip(urls, results))
+        for url, future in batch:
+            if future.done():
+                continue
+            result = by_url[url]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    async def _harvest_page(self, harvester, url: str):
+        """Render one URL once a page slot is free."""
+        async with self._pages:
+            # harvest_single refuses URLs it has already visited; the pool
+            # serves the same URL to many callers, so forget it right before
+            # the call (its visited check runs before its first await)
+            harvester.visited_urls.discard(url)
+            try:
+                return await harvester.harvest_single(url)
+            finally:
+                harvester.visited_urls.discard(url)
+    
+    async def _start(self):
+        """Launch the browser on first use."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._harvester is None:
+                from harvester_browser import BrowserHarvester, HarvestConfig
+                
+                harvester = BrowserHarvester(HarvestConfig(url="", take_screenshots=False))
+                try:
+                    await harvester.__aenter__()
+                except BaseException:
+                    await harvester.__aexit__(None, None, None)
+                    raise
+                self._pages = asyncio.Semaphore(self.max_pages)
+                self._harvester = harvester
+        return self._harvester
+    
+    async def close(self) -> None:
+        """Stop the batch worker, running batches and the browser; the next harvest relaunches them."""
+        self._stop()
+        batches, self._batches = list(self._batches), set()
+        for task in batches:
+            task.cancel()
+        if batches:
+            await asyncio.gather(*batches, return_exceptions=True)
+        harvester, self._harvester = self._harvester, None
+        self._start_lock = None
+        self._pages = None
+        if harvester is not None:
+            await harvester.__aexit__(None, None, None)
+
+
+# Inline color declarations (color=, background:, bg=...) in submitted HTML/CSS
+COLOR_DECLARATION_PATTERN = re.compile(
+    r'(?:color|background|bg)[=:]["\']?(#[0-9a-fA-F]{3,6}|rgb\([^)]+\))',
+    re.IGNORECASE
+)
+
+
+# Components detected in submitted HTML:
+# (blueprint name, marker counted, extra marker that also implies it, width)
+COMPONENT_MARKERS = (
+    ("button", "button", "btn", 100),
+    ("input", "input", None, 200),
+)
+
+# Heading tags detected in submitted HTML, found in one regex pass:
+# level digit -> (level, size, weight)
+HEADING_TAG_PATTERN = re.compile(r'<h([1-6])')
+HEADING_MARKERS = {
+    str(i): (f"h{i}", f"{32 - (i - 1) * 4}px", "700" if i <= 2 else "600")
+    for i in range(1, 7)
+}
+
+# validate_design inputs whose extracted harvester data is kept; oldest
+# entries are evicted first
+HARVESTER_DATA_CACHE_SIZE = 256
+
+# Demo harvest returned when no browser harvester is available; meta is
+# filled in per URL
+SIMULATED_HARVEST = {
+    "_version": 4,
+    "meta": {
+        "url": None,
+        "title": None,
+        "pageType": None,
+        "timestamp": "2024-01-01T00:00:00Z"
+    },
+    "visualAnalysis": {
+        "colors": {
+            "semantic": {
+                "primary": {"base": "#0064FA", "psychology": {"h": 220, "emotion": "professional"}},
+                "success": {"base": "#10B981"},
+                "warning": {"base": "#F59E0B"},
+                "danger": {"base": "#EF4444"},
+                "info": {"base": "#3B82F6"}
+            },
+            "neutrals": {
+                "50": "#F9FAFB", "100": "#F3F4F6", "200": "#E5E7EB",
+                "300": "#D1D5DB", "400": "#9CA3AF", "500": "#6B7280",
+                "600": "#4B5563", "700": "#374151", "800": "#1F2937", "900": "#111827"
+            }
+        },
+        "typography": {
+            "hierarchy": {
+                "h1": {"size": "32px", "weight": "700"},
+                "h2": {"size": "24px", "weight": "600"},
+                "h3": {"size": "20px", "weight": "600"}
+            },
+            "dominant": {
+                "family": "Inter, sans-serif",
+                "size": "14px"
+            }
+        },
+        "layout": {
+            "sidebar": {"width": 240},
+            "header": {"height": 64}
+        },
+        "spacing": {
+            "scale": [4, 8, 12, 16, 20, 24, 32, 40, 48]
+        },
+        "borders": {
+            "radius": {"sm": "3px", "md": "6px", "lg": "12px"}
+        }
+    },
+    "components": {
+        "blueprints": {
+            "button": {
+                "count": 6,
+                "representative": {
+                    "styles": {
+                        "backgroundColor": "#0064FA",
+                        "color": "#FFFFFF",
+                        "padding": "8px 16px",
+                        "borderRadius": "6px"
+                    },
+                    "dimensions": {"width": 100, "height": 40}
+                }
+            },
+            "input": {"count": 5},
+            "card": {"count": 3}
+        }
+    },
+    "quality": {
+        "accessibility": {
+            "contrastIssues": [],
+            "missingLabels": [],
+            "missingFocus": []
+        }
+    }
+}
+
 # ============================================================================
 # MCP Server Implementation
 # ============================================================================
@@ -134,9 +639,6 @@ class UXMasterMCPServer:
     """MCP Server for UX-Master design intelligence."""
     
     def __init__(self):
-        self.search_engine = SearchEngine()
-        self.platform_manager = PlatformManager()
-        
         # Tool handlers
         self.tools = {
             "search_ux_laws": self.handle_search_ux_laws,
@@ -151,6 +653,33 @@ class UXMasterMCPServer:
             "get_design_tokens": self.handle_get_design_tokens,
             "build_design_system": self.handle_build_design_system,
         }
+        
+        # Tool and resource listings never change; build them once
+        self._tools_list = self._build_tools_list()
+        self._resources_list = self._build_resources_list()
+        
+        # Search tools the async endpoint routes through the batcher:
+        # name -> (fixed domain or None to use the input's, formatter)
+        self.search_cache = SearchResultCache()
+        self._harvester_data_cache: dict[bytes, dict] = {}
+        self._harvester_data_lock = threading.Lock()
+        self.search_batcher = SearchBatcher()
+        self.harvester_pool = HarvesterPool()
+        self.batched_search_tools = {
+            "search_ux_laws": ("ux-laws", self._format_ux_laws),
+            "search_design_tests": ("design-tests", self._format_design_tests),
+            "search_domain": (None, self._format_domain_results),
+        }
+    
+    @property
+    def search_engine(self):
+        """Shared SearchEngine, loaded the first time a tool needs it."""
+        return get_search_engine()
+    
+    @property
+    def platform_manager(self):
+        """Shared PlatformManager, loaded the first time a tool needs it."""
+        return get_platform_manager()
     
     # -------------------------------------------------------------------------
     # Tool Handlers
@@ -158,26 +687,49 @@ class UXMasterMCPServer:
     
     def handle_search_ux_laws(self, params: dict) -> dict:
         """Search UX Laws applicable to product type."""
-        input_data = SearchUXLawsInput(**params)
+        input_data = TOOL_INPUT_ADAPTERS["search_ux_laws"].validate_python(params)
         
-        results = self.search_engine.search(
-            query=input_data.query,
-            domain="ux-laws",
-            max_results=input_data.max_results
-        )
+        results = self._search(input_data.query, "ux-laws", input_data.max_results)
         
-        # Format results
-        formatted = []
-        for r in results:
-            formatted.append({
-                "id": r.get("ID"),
-                "name": r.get("Law_Name"),
-                "category": r.get("Law_Category"),
-                "definition": r.get("Definition"),
-                "application": r.get("Application"),
-                "severity": r.get("Severity"),
-                "design_test_id": r.get("Design_Test_ID")
-            })
+        return self._format_ux_laws(input_data, results)
+    
+    def _search(self, query: str, domain: str, max_results: int) -> list[dict]:
+        """Domain search through the result cache."""
+        key = SearchResultCache.key("search", domain, query, max_results)
+        results = self.search_cache.get(key)
+        if results is None:
+            results = self.search_engine.search(query=query, domain=domain, max_results=max_results)
+            self.search_cache.put(key, results)
+        return results
+    
+    def _search_stack(self, query: str, stack: str, max_results: int) -> list[dict]:
+        """Stack guideline search through the result cache."""
+        key = SearchResultCache.key("stack", stack, query, max_results)
+        results = self.search_cache.get(key)
+        if results is None:
+            results = self.search_engine.search_stack(query=query, stack=stack, max_results=max_results)
+            self.search_cache.put(key, results)
+        return results
+    
+    def flush_search_cache(self) -> int:
+        """Empty the search result cache; returns the number of entries dropped."""
+        return self.search_cache.clear()
+    
+    def _format_ux_laws(self, input_data: SearchUXLawsInput, results: list[dict]) -> dict:
+        """Shape ux-laws search rows into the search_ux_laws response."""
+        # Search rows carry every ux-laws output column, so index directly
+        formatted = [
+            {
+                "id": r["ID"],
+                "name": r["Law_Name"],
+                "category": r["Law_Category"],
+                "definition": r["Definition"],
+                "application": r["Application"],
+                "severity": r["Severity"],
+                "design_test_id": r["Design_Test_ID"]
+            }
+            for r in results
+        ]
         
         return {
             "laws": formatted,
@@ -187,27 +739,29 @@ class UXMasterMCPServer:
     
     def handle_search_design_tests(self, params: dict) -> dict:
         """Search Design Tests with validation criteria."""
-        input_data = SearchDesignTestsInput(**params)
+        input_data = TOOL_INPUT_ADAPTERS["search_design_tests"].validate_python(params)
         
-        results = self.search_engine.search(
-            query=input_data.query,
-            domain="design-tests",
-            max_results=input_data.max_results
-        )
+        results = self._search(input_data.query, "design-tests", input_data.max_results)
         
-        formatted = []
-        for r in results:
-            formatted.append({
-                "test_id": r.get("Test_ID"),
-                "target": r.get("Target"),
-                "component": r.get("Component"),
-                "law": r.get("UX_Law_Name"),
-                "assertion": r.get("Assertion"),
-                "pass_criteria": r.get("Pass_Criteria"),
-                "fail_criteria": r.get("Fail_Criteria"),
-                "severity": r.get("Severity"),
-                "test_method": r.get("Test_Method")
-            })
+        return self._format_design_tests(input_data, results)
+    
+    def _format_design_tests(self, input_data: SearchDesignTestsInput, results: list[dict]) -> dict:
+        """Shape design-tests search rows into the search_design_tests response."""
+        # Search rows carry every design-tests output column, so index directly
+        formatted = [
+            {
+                "test_id": r["Test_ID"],
+                "target": r["Target"],
+                "component": r["Component"],
+                "law": r["UX_Law_Name"],
+                "assertion": r["Assertion"],
+                "pass_criteria": r["Pass_Criteria"],
+                "fail_criteria": r["Fail_Criteria"],
+                "severity": r["Severity"],
+                "test_method": r["Test_Method"]
+            }
+            for r in results
+        ]
         
         return {
             "tests": formatted,
@@ -217,16 +771,10 @@ class UXMasterMCPServer:
     
     def handle_validate_design(self, params: dict) -> dict:
         """Validate UI code against Design Tests using Validation Engine v4."""
-        input_data = ValidateDesignInput(**params)
+        input_data = TOOL_INPUT_ADAPTERS["validate_design"].validate_python(params)
         
         try:
-            # Import validation engine
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-            from validation_engine import ValidationEngine
-            
-            # Create engine and run validation
-            engine = ValidationEngine()
+            engine = get_validation_engine()
             
             # Build harvester-compatible data structure from HTML/CSS
             harvester_data = self._build_harvester_data_from_html(
@@ -254,16 +802,83 @@ class UXMasterMCPServer:
                 "message": "Validation failed - check input data"
             }
     
+    def iter_validate_design(self, params: dict) -> Iterator[bytes]:
+        """Run validate_design, yielding NDJSON frames as tests complete.
+        
+        Emits one {"test": ...} line per design test, then a {"result": ...}
+        line with the handler's fields minus the per-test list. Failures
+        become a final {"result": ...} line with the handler's error fields.
+        """
+        try:
+            input_data = TOOL_INPUT_ADAPTERS["validate_design"].validate_python(params)
+            engine = get_validation_engine()
+            harvester_data = self._build_harvester_data_from_html(
+                html=input_data.html,
+                css=input_data.css
+            )
+            
+            results = []
+            for test_result in engine.iter_validate(harvester_data, test_suite=input_data.test_suite):
+                results.append(test_result)
+                yield encode_json({"test": test_result.to_dict()}) + b"\n"
+            
+            report = engine.build_report(results)
+            result = {
+                "status": "completed",
+                "score": report.score,
+                "passed": report.passed_count,
+                "failed": report.failed_count,
+                "total": report.total_count,
+                "summary": report.summary,
+                "critical_issues": report.summary.get("critical_issues", 0)
+            }
+        except Exception as e:
+            result = {
+                "status": "error",
+                "error": str(e),
+                "message": "Validation failed - check input data"
+            }
+        
+        yield encode_json({"result": result}) + b"\n"
+    
     def _build_harvester_data_from_html(self, html: str, css: Optional[str] = None) -> dict:
-        """Build harvester-compatible data from HTML/CSS input."""
-        # Simplified extraction - in production would use BeautifulSoup or similar
-        import re
+        """Build harvester-compatible data from HTML/CSS input.
+        
+        Results are memoized by content hash, since agents often resubmit
+        the same snippet while iterating. The returned dict may be shared
+        between calls and must not be mutated.
+        """
+        # Length-prefix the HTML so no html/css split can collide with another
+        html_bytes = html.encode("utf-8", "surrogatepass")
+        key = hashlib.blake2b(len(html_bytes).to_bytes(8, "little"), digest_size=16)
+        key.update(html_bytes)
+        key.update((css or "").encode("utf-8", "surrogatepass"))
+        key = key.digest()
+        
+        # call_tool runs in worker threads, so the cache is shared between them;
+        # extraction itself happens outside the lock
+        with self._harvester_data_lock:
+            data = self._harvester_data_cache.get(key)
+        if data is None:
+            data = self._extract_harvester_data(html, css)
+            with self._harvester_data_lock:
+                if key not in self._harvester_data_cache and len(self._harvester_data_cache) >= HARVESTER_DATA_CACHE_SIZE:
+                    self._harvester_data_cache.pop(next(iter(self._harvester_data_cache)), None)
+                self._harvester_data_cache[key] = data
+        return data
+    
+    def _extract_harvester_data(self, html: str, css: Optional[str]) -> dict:
+        """Scan HTML/CSS into the harvester v4 structure."""
+        # Simplified extraction - in production would use BeautifulSoup or similar.
+        # All scans read one lowercased copy; lowercasing leaves "<" intact
+        html_lower = html.lower()
+        element_count = html_lower.count("<")
         
         data = {
             "_version": 4,
             "meta": {
                 "pageType": "generic",
-                "elementCount": html.count("<")
+                "elementCount": element_count
             },
             "visualAnalysis": {
                 "colors": {"semantic": {}, "neutrals": {}},
@@ -284,84 +899,82 @@ class UXMasterMCPServer:
             }
         }
         
-        # Extract color hints from HTML
-        color_pattern = r'(?:color|background|bg)[=:]["\']?(#[0-9a-fA-F]{3,6}|rgb\([^)]+\))'
-        colors_found = re.findall(color_pattern, html + (css or ""), re.IGNORECASE)
+        # Extract color hints; HTML and CSS are scanned separately rather
+        # than concatenated into one copy
+        colors_found = COLOR_DECLARATION_PATTERN.findall(html)
+        if css:
+            colors_found += COLOR_DECLARATION_PATTERN.findall(css)
         
         # Basic component detection
-        if "button" in html.lower() or "btn" in html.lower():
-            data["components"]["blueprints"]["button"] = {
-                "count": html.lower().count("button"),
-                "representative": {"dimensions": {"width": 100, "height": 40}},
-                "variants": {}
-            }
-        
-        if "input" in html.lower():
-            data["components"]["blueprints"]["input"] = {
-                "count": html.lower().count("input"),
-                "representative": {"dimensions": {"width": 200, "height": 40}},
-                "variants": {}
-            }
+        blueprints = data["components"]["blueprints"]
+        for component, count_marker, extra_marker, width in COMPONENT_MARKERS:
+            count = html_lower.count(count_marker)
+            if count or (extra_marker and extra_marker in html_lower):
+                blueprints[component] = {
+                    "count": count,
+                    "representative": {"dimensions": {"width": width, "height": 40}},
+                    "variants": {}
+                }
         
         # Typography detection
-        for i in range(1, 7):
-            if f"<h{i}" in html.lower():
-                data["visualAnalysis"]["typography"]["hierarchy"][f"h{i}"] = {
-                    "size": f"{32 - (i-1)*4}px",
-                    "weight": "700" if i <= 2 else "600"
-                }
+        hierarchy = data["visualAnalysis"]["typography"]["hierarchy"]
+        for digit in sorted(set(HEADING_TAG_PATTERN.findall(html_lower))):
+            level, size, weight = HEADING_MARKERS[digit]
+            hierarchy[level] = {"size": size, "weight": weight}
         
         return data
     
     def handle_extract_design_system(self, params: dict) -> dict:
         """Extract design system from website using Harvester v4 + Validation Engine."""
-        input_data = ExtractDesignSystemInput(**params)
-        
+        input_data = TOOL_INPUT_ADAPTERS["extract_design_system"].validate_python(params)
+        harvest_data = asyncio.run(self._harvest_once(input_data.url))
+        return self._extract_design_system(input_data, harvest_data)
+    
+    async def _harvest_once(self, url: str) -> dict:
+        """Harvest url with a browser launched for this call only."""
+        pool = HarvesterPool(max_pages=1, max_wait=0)
+        try:
+            return await self._harvest(url, pool)
+        finally:
+            await pool.close()
+    
+    async def _harvest(self, url: str, pool: HarvesterPool) -> dict:
+        """Harvest url through pool, or simulate when no browser is available."""
+        if not browser_harvester_available():
+            return self._simulate_harvester_data(url)
+        try:
+            return await pool.harvest(url)
+        except Exception:
+            # Browser launch or page load failed: simulate harvester data
+            return self._simulate_harvester_data(url)
+    
+    def _extract_design_system(self, input_data: ExtractDesignSystemInput, harvest_data: dict) -> dict:
+        """Index and validate harvested data into the extract_design_system result."""
         try:
-            # Import harvester and validation modules
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-            
-            # Try to use browser-based harvester
-            try:
-                from harvester_browser import BrowserHarvester
-                
-                harvester = BrowserHarvester()
-                harvest_result = harvester.harvest(
-                    url=input_data.url,
-                    depth=input_data.depth,
-                    include_screenshots=input_data.include_screenshots
-                )
-                
-                if not harvest_result.get("success"):
-                    raise Exception(harvest_result.get("error", "Unknown error"))
-                
-                harvest_data = harvest_result.get("data", {})
-                
-            except Exception as harvest_error:
-                # Fallback: simulate harvester data
-                harvest_data = self._simulate_harvester_data(input_data.url)
-            
             # Index design system
-            try:
+            css_output = "/* Design system indexing failed */"
+            design_system = None
+            if module_available("design_system_indexer"):
                 from design_system_indexer import DesignSystemIndexer
-                indexer = DesignSystemIndexer(harvest_data, name="Extracted")
-                design_system = indexer.index()
-                
-                # Generate CSS
-                css_output = design_system.generate_css()
-                
-            except Exception as index_error:
-                css_output = "/* Design system indexing failed */"
-                design_system = None
+                try:
+                    indexer = DesignSystemIndexer(harvest_data, name="Extracted")
+                    design_system = indexer.index()
+                    
+                    # Generate CSS
+                    css_output = design_system.generate_css()
+                    
+                except Exception as index_error:
+                    css_output = "/* Design system indexing failed */"
+                    design_system = None
             
             # Run validation on extracted data
-            try:
-                from validation_engine import ValidationEngine
-                validator = ValidationEngine()
-                validation_report = validator.validate(harvest_data, test_suite="all")
-            except Exception as val_error:
-                validation_report = None
+            validation_report = None
+            if module_available("validation_engine"):
+                try:
+                    validator = get_validation_engine()
+                    validation_report = validator.validate(harvest_data, test_suite="all")
+                except Exception as val_error:
+                    validation_report = None
             
             return {
                 "status": "completed",
@@ -384,87 +997,27 @@ class UXMasterMCPServer:
             }
     
     def _simulate_harvester_data(self, url: str) -> dict:
-        """Simulate harvester output for demo/development."""
-        import random
+        """Simulate harvester output for demo/development.
         
+        Only meta depends on the URL; every other section is the shared
+        SIMULATED_HARVEST template, which callers must not mutate.
+        """
         # Generate realistic-looking data based on URL
-        domain = url.split("/")[2] if "//" in url else url
+        domain = urlsplit(url).netloc or url
         
         return {
-            "_version": 4,
+            **SIMULATED_HARVEST,
             "meta": {
+                **SIMULATED_HARVEST["meta"],
                 "url": url,
                 "title": f"Extracted from {domain}",
-                "pageType": "dashboard" if "admin" in url or "dashboard" in url else "landing",
-                "timestamp": "2024-01-01T00:00:00Z"
-            },
-            "visualAnalysis": {
-                "colors": {
-                    "semantic": {
-                        "primary": {"base": "#0064FA", "psychology": {"h": 220, "emotion": "professional"}},
-                        "success": {"base": "#10B981"},
-                        "warning": {"base": "#F59E0B"},
-                        "danger": {"base": "#EF4444"},
-                        "info": {"base": "#3B82F6"}
-                    },
-                    "neutrals": {
-                        "50": "#F9FAFB", "100": "#F3F4F6", "200": "#E5E7EB",
-                        "300": "#D1D5DB", "400": "#9CA3AF", "500": "#6B7280",
-                        "600": "#4B5563", "700": "#374151", "800": "#1F2937", "900": "#111827"
-                    }
-                },
-                "typography": {
-                    "hierarchy": {
-                        "h1": {"size": "32px", "weight": "700"},
-                        "h2": {"size": "24px", "weight": "600"},
-                        "h3": {"size": "20px", "weight": "600"}
-                    },
-                    "dominant": {
-                        "family": "Inter, sans-serif",
-                        "size": "14px"
-                    }
-                },
-                "layout": {
-                    "sidebar": {"width": 240},
-                    "header": {"height": 64}
-                },
-                "spacing": {
-                    "scale": [4, 8, 12, 16, 20, 24, 32, 40, 48]
-                },
-                "borders": {
-                    "radius": {"sm": "3px", "md": "6px", "lg": "12px"}
-                }
-            },
-            "components": {
-                "blueprints": {
-                    "button": {
-                        "count": random.randint(3, 10),
-                        "representative": {
-                            "styles": {
-                                "backgroundColor": "#0064FA",
-                                "color": "#FFFFFF",
-                                "padding": "8px 16px",
-                                "borderRadius": "6px"
-                            },
-                            "dimensions": {"width": 100, "height": 40}
-                        }
-                    },
-                    "input": {"count": random.randint(2, 8)},
-                    "card": {"count": random.randint(1, 5)}
-                }
-            },
-            "quality": {
-                "accessibility": {
-                    "contrastIssues": [],
-                    "missingLabels": [],
-                    "missingFocus": []
-                }
+                "pageType": "dashboard" if "admin" in url or "dashboard" in url else "landing"
             }
         }
     
     def handle_generate_design_system(self, params: dict) -> dict:
         """Generate complete design system recommendation."""
-        input_data = GenerateDesignSystemInput(**params)
+        input_data = TOOL_INPUT_ADAPTERS["generate_design_system"].validate_python(params)
         
         result = self.search_engine.generate_design_system(
             query=input_data.query,
@@ -479,14 +1032,14 @@ class UXMasterMCPServer:
     
     def handle_search_domain(self, params: dict) -> dict:
         """Search specific domain."""
-        input_data = SearchDomainInput(**params)
+        input_data = TOOL_INPUT_ADAPTERS["search_domain"].validate_python(params)
         
-        results = self.search_engine.search(
-            query=input_data.query,
-            domain=input_data.domain,
-            max_results=input_data.max_results
-        )
+        results = self._search(input_data.query, input_data.domain, input_data.max_results)
         
+        return self._format_domain_results(input_data, results)
+    
+    def _format_domain_results(self, input_data: SearchDomainInput, results: list[dict]) -> dict:
+        """Shape raw search rows into the search_domain response."""
         return {
             "domain": input_data.domain,
             "results": results,
@@ -496,18 +1049,24 @@ class UXMasterMCPServer:
     
     def handle_export_to_figma(self, params: dict) -> dict:
         """Export design tokens to Figma."""
-        input_data = ExportToFigmaInput(**params)
-        
+        input_data = TOOL_INPUT_ADAPTERS["export_to_figma"].validate_python(params)
+        return asyncio.run(self._export_to_figma(input_data))
+    
+    async def _export_to_figma(self, input_data: ExportToFigmaInput) -> dict:
+        """Run the Figma export on the caller's event loop."""
         # Import Figma integration
         from .integrations.figma.client import FigmaClient
         
         try:
             client = FigmaClient()
-            result = client.create_variables_collection(
-                file_key=input_data.file_key,
-                tokens=input_data.design_tokens,
-                collection_name=input_data.collection_name
-            )
+            try:
+                result = await client.create_variables_collection(
+                    file_key=input_data.file_key,
+                    tokens=input_data.design_tokens,
+                    collection_name=input_data.collection_name
+                )
+            finally:
+                await client.close()
             return {
                 "success": True,
                 "figma_response": result
@@ -520,13 +1079,9 @@ class UXMasterMCPServer:
     
     def handle_get_stack_guidelines(self, params: dict) -> dict:
         """Get stack-specific guidelines."""
-        input_data = GetStackGuidelinesInput(**params)
+        input_data = TOOL_INPUT_ADAPTERS["get_stack_guidelines"].validate_python(params)
         
-        results = self.search_engine.search_stack(
-            query=input_data.query,
-            stack=input_data.stack,
-            max_results=5
-        )
+        results = self._search_stack(input_data.query, input_data.stack, 5)
         
         return {
             "stack": input_data.stack,
@@ -539,52 +1094,68 @@ class UXMasterMCPServer:
     # -------------------------------------------------------------------------
     
     def list_tools(self) -> list[dict]:
-        """List available tools."""
+        """List available tools.
+        
+        Built once per server; the returned list is shared and must not be
+        mutated.
+        """
+        return self._tools_list
+    
+    def list_resources(self) -> list[dict]:
+        """List available resources.
+        
+        Built once per server; the returned list is shared and must not be
+        mutated.
+        """
+        return self._resources_list
+    
+    def _build_tools_list(self) -> list[dict]:
+        """Build the tool definitions, schemas included."""
         return [
             {
                 "name": "search_ux_laws",
                 "description": "Search 48 UX Laws applicable to product type. Returns laws with definitions, applications, and severity levels.",
-                "inputSchema": SearchUXLawsInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["search_ux_laws"].json_schema()
             },
             {
                 "name": "search_design_tests",
                 "description": "Search 37 Design Tests with pass/fail criteria. Use for validating UI implementations.",
-                "inputSchema": SearchDesignTestsInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["search_design_tests"].json_schema()
             },
             {
                 "name": "validate_design",
                 "description": "Validate HTML/CSS code against Design Tests. Returns detailed pass/fail report.",
-                "inputSchema": ValidateDesignInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["validate_design"].json_schema()
             },
             {
                 "name": "extract_design_system",
                 "description": "Extract design tokens from a website URL using AI-powered analysis.",
-                "inputSchema": ExtractDesignSystemInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["extract_design_system"].json_schema()
             },
             {
                 "name": "generate_design_system",
                 "description": "Generate a complete design system recommendation based on project description.",
-                "inputSchema": GenerateDesignSystemInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["generate_design_system"].json_schema()
             },
             {
                 "name": "search_domain",
                 "description": "Search specific domain (ux-laws, design-tests, style, color, typography, etc.)",
-                "inputSchema": SearchDomainInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["search_domain"].json_schema()
             },
             {
                 "name": "export_to_figma",
                 "description": "Export design tokens to Figma as Variables collection.",
-                "inputSchema": ExportToFigmaInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["export_to_figma"].json_schema()
             },
             {
                 "name": "get_stack_guidelines",
                 "description": "Get technology stack specific guidelines (React, Vue, Tailwind, etc.)",
-                "inputSchema": GetStackGuidelinesInput.schema()
+                "inputSchema": TOOL_INPUT_ADAPTERS["get_stack_guidelines"].json_schema()
             }
         ]
     
-    def list_resources(self) -> list[dict]:
-        """List available resources."""
+    def _build_resources_list(self) -> list[dict]:
+        """Build the resource definitions."""
         return [
             {
                 "uri": "uxmaster://ux-laws/all",
@@ -619,13 +1190,45 @@ class UXMasterMCPServer:
         
         handler = self.tools[name]
         return handler(arguments)
+    
+    async def call_tool_async(self, name: str, arguments: dict) -> dict:
+        """Call a tool from the event loop without blocking it.
+        
+        Searches are batched, the Figma export and website harvests run
+        natively async (harvests in the shared browser), and the remaining
+        blocking handlers run on a worker thread.
+        """
+        if name == "export_to_figma":
+            input_data = TOOL_INPUT_ADAPTERS[name].validate_python(arguments)
+            return await self._export_to_figma(input_data)
+        
+        if name == "extract_design_system":
+            input_data = TOOL_INPUT_ADAPTERS[name].validate_python(arguments)
+            harvest_data = await self._harvest(input_data.url, self.harvester_pool)
+            return await asyncio.to_thread(self._extract_design_system, input_data, harvest_data)
+        
+        if name not in self.batched_search_tools:
+            return await asyncio.to_thread(self.call_tool, name, arguments)
+        
+        domain, formatter = self.batched_search_tools[name]
+        input_data = TOOL_INPUT_ADAPTERS[name].validate_python(arguments)
+        domain = domain or input_data.domain
+        key = SearchResultCache.key("search", domain, input_data.query, input_data.max_results)
+        results = self.search_cache.get(key)
+        if results is None:
+            results = await self.search_batcher.search(
+                input_data.query,
+                domain,
+                input_data.max_results
+            )
+            self.search_cache.put(key, results)
+        return formatter(input_data, results)
 
     # ── Design System Management Tools ────────────────────────
 
     def handle_list_design_systems(self, params: dict) -> dict:
         """List all design system projects in the central registry."""
         try:
-            sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
             from project_registry import ProjectRegistry
             registry = ProjectRegistry()
             projects = registry.list_all()
@@ -643,7 +1246,6 @@ class UXMasterMCPServer:
         if not slug:
             return {"error": "slug is required"}
         try:
-            sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
             from project_registry import ProjectRegistry
             registry = ProjectRegistry()
             project = registry.get(slug)
@@ -665,7 +1267,6 @@ class UXMasterMCPServer:
         if not slug:
             return {"error": "slug is required"}
         try:
-            sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
             from project_registry import ProjectRegistry
             from site_generator import SiteGenerator
 
@@ -703,16 +1304,32 @@ class UXMasterMCPServer:
 
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Close the shared browser harvester when the server stops."""
+    yield
+    await mcp_server.harvester_pool.close()
+
+
 app = FastAPI(
     title="UX-Master MCP Server",
     description="Model Context Protocol server for UX design intelligence",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
+)
+
+# Origins allowed to call the server cross-origin: VS Code webviews,
+# vscode.dev and local development servers. Starlette compiles the
+# pattern once and fullmatches it against each request's Origin.
+CORS_ORIGIN_REGEX = os.getenv(
+    "CORS_ORIGIN_REGEX",
+    r"vscode-webview://[\w.-]+|https://vscode\.dev|https?://(?:localhost|127\.0\.0\.1)(?::\d+)?"
 )
 
 # CORS for VS Code extension
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -722,72 +1339,122 @@ app.add_middleware(
 mcp_server = UXMasterMCPServer()
 
 
+# Static endpoint payloads, encoded once instead of on every request
+INITIALIZE_BODY = encode_json({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {},
+        "resources": {}
+    },
+    "serverInfo": {
+        "name": "ux-master",
+        "version": "2.0.0"
+    }
+})
+HEALTH_BODY = encode_json({"status": "healthy", "version": "2.0.0"})
+
+
 @app.post("/mcp/v1/initialize")
 async def initialize():
     """MCP initialize endpoint."""
-    return {
-        "protocolVersion": "2024-11-05",
-        "capabilities": {
-            "tools": {},
-            "resources": {}
-        },
-        "serverInfo": {
-            "name": "ux-master",
-            "version": "2.0.0"
-        }
-    }
+    return Response(content=INITIALIZE_BODY, media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def tools_list_body() -> bytes:
+    """Encoded /mcp/v1/tools/list response, built on first request."""
+    return encode_json({"tools": mcp_server.list_tools()})
+
+
+@lru_cache(maxsize=1)
+def resources_list_body() -> bytes:
+    """Encoded /mcp/v1/resources/list response, built on first request."""
+    return encode_json({"resources": mcp_server.list_resources()})
 
 
 @app.post("/mcp/v1/tools/list")
 async def list_tools():
     """List available tools."""
-    return {"tools": mcp_server.list_tools()}
+    return Response(content=tools_list_body(), media_type="application/json")
+
+
+def tool_call_body(result: Any, is_error: bool = False, pretty: bool = False) -> bytes:
+    """Encode an MCP tools/call response carrying result as its text content.
+    
+    The envelope is fixed, so only result's JSON text is encoded (and then
+    escaped as a JSON string) rather than also building and encoding an
+    envelope dict around it. The text is compact unless pretty is set.
+    """
+    text = encode_json(encode_json(result, indent=pretty).decode("utf-8"))
+    tail = b'}],"isError":true}' if is_error else b'}]}'
+    return b'{"content":[{"type":"text","text":' + text + tail
 
 
 @app.post("/mcp/v1/tools/call")
-async def call_tool(request: dict):
-    """Call a tool."""
+async def call_tool(request: dict, pretty: bool = False):
+    """Call a tool; ?pretty=1 indents the result text for debugging."""
     try:
         name = request.get("name")
         arguments = request.get("arguments", {})
         
-        result = mcp_server.call_tool(name, arguments)
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": json.dumps(result, indent=2)
-                }
-            ]
-        }
+        result = await mcp_server.call_tool_async(name, arguments)
+        body = tool_call_body(result, pretty=pretty)
     except Exception as e:
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": json.dumps({"error": str(e)}, indent=2)
-                }
-            ],
-            "isError": True
-        }
+        body = tool_call_body({"error": str(e)}, is_error=True, pretty=pretty)
+    
+    return Response(content=body, media_type="application/json")
+
+
+@app.post("/mcp/v1/tools/call/stream")
+async def call_tool_stream(request: dict):
+    """Call a tool, streaming NDJSON frames while it runs.
+    
+    Only validate_design streams; its per-test frames let clients show
+    progress without holding the whole report in one payload.
+    """
+    from fastapi.responses import StreamingResponse
+    
+    name = request.get("name")
+    if name != "validate_design":
+        return Response(
+            content=encode_json({"error": f"Tool does not support streaming: {name}"}),
+            status_code=400,
+            media_type="application/json"
+        )
+    
+    # A plain generator: Starlette iterates it on a worker thread
+    return StreamingResponse(
+        mcp_server.iter_validate_design(request.get("arguments", {})),
+        media_type="application/x-ndjson"
+    )
 
 
 @app.post("/mcp/v1/resources/list")
 async def list_resources():
     """List available resources."""
-    return {"resources": mcp_server.list_resources()}
+    return Response(content=resources_list_body(), media_type="application/json")
+
+
+@app.post("/mcp/v1/admin/search-cache/flush")
+async def flush_search_cache():
+    """Drop cached search results in the worker process serving this request.
+    
+    With WORKERS > 1 every worker keeps its own cache; the response names
+    the worker that was flushed.
+    """
+    return {"flushed": mcp_server.flush_search_cache(), "pid": os.getpid()}
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "version": "2.0.0"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/")
-async def root():
-    """Root endpoint with documentation."""
-    return {
+@lru_cache(maxsize=1)
+def root_body() -> bytes:
+    """Encoded / response, built on first request once the tools are registered."""
+    return encode_json({
         "name": "UX-Master MCP Server",
         "version": "2.0.0",
         "description": "Ultimate UX Design Intelligence",
@@ -795,6 +1462,7 @@ async def root():
             "initialize": "/mcp/v1/initialize",
             "tools": "/mcp/v1/tools/list",
             "call_tool": "/mcp/v1/tools/call",
+            "call_tool_stream": "/mcp/v1/tools/call/stream",
             "resources": "/mcp/v1/resources/list",
             "health": "/health"
         },
@@ -806,7 +1474,13 @@ async def root():
             "17 Technology Stacks",
             "Figma Integration"
         ]
-    }
+    })
+
+
+@app.get("/")
+async def root():
+    """Root endpoint with documentation."""
+    return Response(content=root_body(), media_type="application/json")
 
 
 # ============================================================================
@@ -818,6 +1492,8 @@ if __name__ == "__main__":
     
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 3000))
+    # Caches and the harvester browser are per process; see WORKERS above
+    workers = int(os.getenv("WORKERS", 1))
     
     print(f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -828,6 +1504,7 @@ if __name__ == "__main__":
 ╠══════════════════════════════════════════════════════════════╣
 ║   Port: {port:<5}                                             ║
 ║   Host: {host:<15}                                       ║
+║   Workers: {workers:<3}                                               ║
 ║                                                              ║
 ║   Endpoints:                                                 ║
 ║   • POST /mcp/v1/initialize                                  ║
@@ -848,4 +1525,14 @@ if __name__ == "__main__":
 ╚══════════════════════════════════════════════════════════════╝
     """)
     
-    uvicorn.run(app, host=host, port=port)
+    # Workers are separate processes that import the app by name: "server"
+    # when run as a script, "mcp.server" under python -m. uvicorn picks
+    # uvloop and httptools (both in uvicorn[standard]) when installed and
+    # falls back to asyncio and h11 otherwise.
+    app_module = __spec__.name if __spec__ else "server"
+    uvicorn.run(
+        f"{app_module}:app",
+        host=host,
+        port=port,
+        workers=workers
+    )
@@ -18,6 +18,7 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
 def generate_doc_html(tokens: dict, harvest: dict = None, meta: dict = None, confidence: dict = None) -> str:
@@ -37,42 +38,24 @@ def generate_doc_html(tokens: dict, harvest: dict = None, meta: dict = None, con
     page_count = meta.get("page_count", meta.get("harvest_count", 1))
 
     # Categorize tokens
-    brand_colors = {}
-    semantic_colors = {}
-    surface_colors = {}
-    text_colors = {}
-    typography_tokens = {}
-    geometry_tokens = {}
-    shadow_tokens = {}
-
-    for var, val in sorted(tokens.items()):
-        if "primary" in var:
-            brand_colors[var] = val
-        elif any(s in var for s in ("success", "warning", "danger")):
-            semantic_colors[var] = val
-        elif "bg-" in var or "border" in var:
-            surface_colors[var] = val
-        elif "text-" in var:
-            text_colors[var] = val
-        elif "font-" in var:
-            typography_tokens[var] = val
-        elif "shadow" in var:
-            shadow_tokens[var] = val
-        elif "radius" in var:
-            geometry_tokens[var] = val
-        else:
-            geometry_tokens[var] = val
+    sorted_items = sorted(tokens.items())
+    groups = {group: {} for group in _TOKEN_GROUPS}
+    for var, val in sorted_items:
+        groups[_token_group(var)][var] = val
+
+    typography_tokens = groups["typography"]
+    geometry_tokens = groups["geometry"]
+    shadow_tokens = groups["shadow"]
 
     # Build HTML sections
-    color_swatches_html = _build_color_section("Brand Colors", brand_colors)
-    color_swatches_html += _build_color_section("Semantic Colors", semantic_colors)
-    color_swatches_html += _build_color_section("Surface Colors", surface_colors)
-    color_swatches_html += _build_color_section("Text Colors", text_colors)
+    color_swatches_html = "".join(
+        _build_color_section(title, groups[group]) for group, title in _COLOR_SECTIONS
+    )
 
     typography_html = _build_typography_section(typography_tokens, harvest)
     geometry_html = _build_geometry_section(geometry_tokens, shadow_tokens)
     components_html = _build_components_section(tokens, harvest)
-    token_table_html = _build_token_table(tokens, confidence)
+    token_table_html = _build_token_table(tokens, confidence, sorted_items=sorted_items)
     usage_html = _build_usage_section(project_name)
 
     # v3 sections
@@ -89,7 +72,7 @@ def generate_doc_html(tokens: dict, harvest: dict = None, meta: dict = None, con
     <meta name="generator" content="UX Master — https://ux-master.todyai.io">
     <title>{_esc(project_name)} — Design System</title>
     <style>
-{_get_css(tokens)}
+{_get_css(tokens.get("--semi-color-primary", "#2463EB"))}
     </style>
 </head>
 <body>
@@ -199,30 +182,75 @@ def generate_doc_html(tokens: dict, harvest: dict = None, meta: dict = None, con
     return html
 
 
+# Token groups rendered as separate documentation sections
+_TOKEN_GROUPS = ("brand", "semantic", "surface", "text", "typography", "geometry", "shadow")
+
+# Color groups and their subsection headings, in page order (headings are HTML-safe)
+_COLOR_SECTIONS = (
+    ("brand", "Brand Colors"),
+    ("semantic", "Semantic Colors"),
+    ("surface", "Surface Colors"),
+    ("text", "Text Colors"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _token_group(var: str) -> str:
+    """Return the documentation section a token variable belongs to."""
+    if "primary" in var:
+        return "brand"
+    if "success" in var or "warning" in var or "danger" in var:
+        return "semantic"
+    if "bg-" in var or "border" in var:
+        return "surface"
+    if "text-" in var:
+        return "text"
+    if "font-" in var:
+        return "typography"
+    if "shadow" in var:
+        return "shadow"
+    return "geometry"
+
+
 def _esc(s: str) -> str:
     """HTML-escape a string."""
-    return (s or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    if not s:
+        return ""
+    # Most token values (hex colors, px sizes) need no escaping at all
+    if "&" not in s and "<" not in s and ">" not in s and '"' not in s:
+        return s
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+@lru_cache(maxsize=1024)
+def _token_label(var: str, prefix: str) -> str:
+    """Return the escaped display label for a token, e.g. 'Primary Hover'."""
+    return _esc(var.replace(prefix, "").replace("-", " ").title())
 
 
 def _build_color_section(title: str, colors: dict) -> str:
-    """Build HTML for a color group."""
+    """Build HTML for a color group.
+
+    ``title`` is inserted as-is and must already be HTML-safe.
+    """
     if not colors:
         return ""
     
     swatches = []
     for var, val in colors.items():
-        label = var.replace("--semi-color-", "").replace("-", " ").title()
+        esc_label = _token_label(var, "--semi-color-")
+        esc_val = _esc(val)
         swatches.append(f"""
-            <div class="swatch" onclick="copyColor('{_esc(val)}')">
-                <div class="swatch-color" style="background: {_esc(val)}"></div>
+            <div class="swatch" onclick="copyColor('{esc_val}')">
+                <div class="swatch-color" style="background: {esc_val}"></div>
                 <div class="swatch-info">
-                    <div class="swatch-name">{_esc(label)}</div>
-                    <code class="swatch-value">{_esc(val)}</code>
+                    <div class="swatch-name">{esc_label}</div>
+                    <code class="swatch-value">{esc_val}</code>
                 </div>
             </div>""")
 
     return f"""
-        <h3 class="subsection-title">{_esc(title)}</h3>
+        <h3 class="subsection-title">{title}</h3>
         <div class="swatch-grid">{"".join(swatches)}
         </div>"""
 
@@ -275,24 +303,26 @@ def _build_geometry_section(geometry_tokens: dict, shadow_tokens: dict) -> str:
     items = []
     
     for var, val in geometry_tokens.items():
-        label = var.replace("--semi-", "").replace("-", " ").title()
+        esc_label = _token_label(var, "--semi-")
+        esc_val = _esc(val)
         items.append(f"""
             <div class="geo-item">
-                <div class="geo-preview" style="border-radius: {_esc(val)}"></div>
+                <div class="geo-preview" style="border-radius: {esc_val}"></div>
                 <div class="geo-info">
-                    <div class="geo-label">{_esc(label)}</div>
-                    <code>{_esc(val)}</code>
+                    <div class="geo-label">{esc_label}</div>
+                    <code>{esc_val}</code>
                 </div>
             </div>""")
 
     for var, val in shadow_tokens.items():
-        label = var.replace("--semi-", "").replace("-", " ").title()
+        esc_label = _token_label(var, "--semi-")
+        esc_val = _esc(val)
         items.append(f"""
             <div class="geo-item">
-                <div class="geo-preview geo-shadow" style="box-shadow: {_esc(val)}"></div>
+                <div class="geo-preview geo-shadow" style="box-shadow: {esc_val}"></div>
                 <div class="geo-info">
-                    <div class="geo-label">{_esc(label)}</div>
-                    <code>{_esc(val)}</code>
+                    <div class="geo-label">{esc_label}</div>
+                    <code>{esc_val}</code>
                 </div>
             </div>""")
 
@@ -454,11 +484,12 @@ def _build_neutrals_section(neutrals: dict) -> str:
     for step in ["50", "100", "200", "300", "400", "500", "600", "700", "800", "900"]:
         val = neutrals.get(step, neutrals.get(int(step), ""))
         if val:
+            esc_val = _esc(val)
             swatches.append(f"""
-                <div class="neutral-swatch" onclick="copyColor('{_esc(val)}')">
-                    <div class="neutral-color" style="background: {_esc(val)}"></div>
+                <div class="neutral-swatch" onclick="copyColor('{esc_val}')">
+                    <div class="neutral-color" style="background: {esc_val}"></div>
                     <div class="neutral-label">{step}</div>
-                    <code class="neutral-hex">{_esc(val)}</code>
+                    <code class="neutral-hex">{esc_val}</code>
                 </div>""")
 
     if not swatches:
@@ -479,10 +510,11 @@ def _build_spacing_section(spacing: dict) -> str:
     bars = []
     for val in scale:
         px = val.replace("px", "")
+        esc_val = _esc(val)
         bars.append(f"""
             <div class="spacing-item">
-                <code class="spacing-value">{_esc(val)}</code>
-                <div class="spacing-bar" style="width: {_esc(val)}; min-width: 4px"></div>
+                <code class="spacing-value">{esc_val}</code>
+                <div class="spacing-bar" style="width: {esc_val}; min-width: 4px"></div>
                 <span class="spacing-px">{_esc(px)}</span>
             </div>""")
 
@@ -534,49 +566,56 @@ def _build_layout_section(layout: dict) -> str:
         </div>"""
 
 
-def _build_token_table(tokens: dict, confidence: dict = None) -> str:
-    """Build full token reference table."""
+@lru_cache(maxsize=1024)
+def _token_category(var: str) -> tuple:
+    """Classify a token variable for the reference table.
+
+    Returns (category, chip_prefixes) where chip_prefixes lists the value
+    prefixes that get an inline color preview, or None for no preview.
+    Depends only on the variable name, so repeated Semi names hit the cache.
+    """
+    if "data-" in var:
+        return "Chart", ("",)
+    if "neutral-" in var or "grey-" in var:
+        return "Neutral", ("#",)
+    if "radius" in var or "thickness" in var:
+        return "Border", None
+    if "border" in var and "color" not in var:
+        return "Border", None
+    if "shadow" in var:
+        return "Shadow", None
+    if "font" in var or "line-height" in var:
+        return "Typography", None
+    if "spacing" in var:
+        return "Spacing", None
+    if "height" in var or "width-icon" in var:
+        return "Sizing", None
+    if "layout" in var:
+        return "Layout", None
+    if "color" in var or "bg-" in var or "text-" in var or "fill-" in var:
+        return "Color", ("#", "rgb")
+    return "Other", None
+
+
+def _build_token_table(tokens: dict, confidence: dict = None, sorted_items: list = None) -> str:
+    """Build full token reference table.
+
+    Callers that already sorted ``tokens.items()`` can pass the list as
+    ``sorted_items`` to skip sorting it again.
+    """
     rows = []
-    for var, val in sorted(tokens.items()):
-        # Determine category
-        if "data-" in var:
-            cat = "Chart"
-            preview = f'<span class="token-color-preview" style="background:{_esc(val)}"></span>'
-        elif "neutral-" in var or "grey-" in var:
-            cat = "Neutral"
-            preview = f'<span class="token-color-preview" style="background:{_esc(val)}"></span>' if val.startswith("#") else ""
-        elif "radius" in var or "thickness" in var:
-            cat = "Border"
-            preview = ""
-        elif "border" in var and "color" not in var:
-            cat = "Border"
-            preview = ""
-        elif "shadow" in var:
-            cat = "Shadow"
-            preview = ""
-        elif "font" in var or "line-height" in var:
-            cat = "Typography"
-            preview = ""
-        elif "spacing" in var:
-            cat = "Spacing"
-            preview = ""
-        elif "height" in var or "width-icon" in var:
-            cat = "Sizing"
-            preview = ""
-        elif "layout" in var:
-            cat = "Layout"
-            preview = ""
-        elif "color" in var or "bg-" in var or "text-" in var or "fill-" in var:
-            cat = "Color"
-            preview = f'<span class="token-color-preview" style="background:{_esc(val)}"></span>' if val.startswith("#") or val.startswith("rgb") else ""
+    for var, val in sorted_items if sorted_items is not None else sorted(tokens.items()):
+        cat, chip_prefixes = _token_category(var)
+        esc_val = _esc(val)
+        if chip_prefixes and val.startswith(chip_prefixes):
+            preview = f'<span class="token-color-preview" style="background:{esc_val}"></span>'
         else:
-            cat = "Other"
             preview = ""
 
         rows.append(f"""
                 <tr>
                     <td><code>{_esc(var)}</code></td>
-                    <td>{preview} {_esc(val)}</td>
+                    <td>{preview} {esc_val}</td>
                     <td>{cat}</td>
                 </tr>""")
 
@@ -627,10 +666,13 @@ import './semi-theme-override.css';</code></pre>
         </div>"""
 
 
-def _get_css(tokens: dict) -> str:
-    """Generate the embedded CSS for the doc page."""
-    primary = tokens.get("--semi-color-primary", "#2463EB")
-    
+@lru_cache(maxsize=32)
+def _get_css(primary: str) -> str:
+    """Generate the embedded CSS for the doc page.
+
+    The stylesheet only varies with the primary color, so it is built once
+    per distinct primary and reused.
+    """
     return f"""
         :root {{
             --doc-primary: {primary};
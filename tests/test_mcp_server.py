@@ -23,7 +23,7 @@ sys.modules["fastapi.middleware.cors"] = MagicMock()
 sys.modules["pydantic"] = MagicMock()
 
 # Now import our code
-from server import UXMasterMCPServer
+from server import UXMasterMCPServer, SearchResultCache
 
 
 # =============================================================================
@@ -196,10 +196,7 @@ class TestExtractDesignSystem:
     
     def test_extract_returns_design_system(self, mcp_server):
         """Test extraction returns proper structure."""
-        params = {
-            "url": "https://example.com",
-            "depth": 1
-        }
+        params = {"url": "https://example.com"}
         
         result = mcp_server.handle_extract_design_system(params)
         
@@ -349,7 +346,7 @@ class TestEndpoints:
         """Test /mcp/v1/initialize endpoint."""
         from server import initialize
         
-        result = await initialize()
+        result = json.loads((await initialize()).body)
         
         assert result["protocolVersion"] == "2024-11-05"
         assert "capabilities" in result
@@ -361,7 +358,7 @@ class TestEndpoints:
         """Test /health endpoint."""
         from server import health
         
-        result = await health()
+        result = json.loads((await health()).body)
         
         assert result["status"] == "healthy"
         assert "version" in result
@@ -414,6 +411,96 @@ class TestIntegration:
         assert "guidelines" in stack_result
 
 
+# =============================================================================
+# SEARCH CACHE TESTS
+# =============================================================================
+
+class TestSearchResultCache:
+    """Test the search result LRU."""
+    
+    def test_key_normalizes_query(self):
+        """Test case and whitespace variants share one key."""
+        assert SearchResultCache.key("search", None, "  Mobile   Touch ", 3) == \
+            SearchResultCache.key("search", None, "mobile touch", 3)
+    
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is dropped when full."""
+        cache = SearchResultCache(maxsize=2)
+        cache.put(("a",), [{"n": 1}])
+        cache.put(("b",), [{"n": 2}])
+        cache.get(("a",))
+        cache.put(("c",), [{"n": 3}])
+        
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == [{"n": 1}]
+        assert cache.get(("c",)) == [{"n": 3}]
+    
+    def test_clear_returns_count(self):
+        """Test clear() drops every entry and reports how many."""
+        cache = SearchResultCache()
+        cache.put(("a",), [])
+        cache.put(("b",), [])
+        
+        assert cache.clear() == 2
+        assert cache.get(("a",)) is None
+        assert cache.clear() == 0
+    
+    def test_server_flush(self, mcp_server):
+        """Test flushing the server cache forces a fresh search."""
+        params = {"query": "mobile touch targets", "max_results": 3}
+        mcp_server.handle_search_ux_laws(params)
+        
+        assert mcp_server.flush_search_cache() >= 1
+        assert mcp_server.flush_search_cache() == 0
+
+
+# =============================================================================
+# BATCHING TESTS
+# =============================================================================
+
+class TestSearchBatcher:
+    """Test batched search dispatch."""
+    
+    def test_engine_failure_resolves_callers(self):
+        """Test a failing engine lookup raises in every waiting caller."""
+        import asyncio
+        from server import SearchBatcher
+        
+        async def run():
+            batcher = SearchBatcher(max_wait=0.01)
+            calls = [batcher.search(f"query {i}", None, 3) for i in range(3)]
+            results = await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), 2)
+            return results
+        
+        with patch("server.get_search_engine", side_effect=RuntimeError("engine init failed")):
+            results = asyncio.run(run())
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
+    
+    def test_dispatch_error_keeps_worker_running(self):
+        """Test a raising _dispatch fails its batch and the next batch still runs."""
+        import asyncio
+        from server import MicroBatcher
+        
+        class FlakyBatcher(MicroBatcher):
+            async def _dispatch(self, batch):
+                if batch[0][0] == "bad":
+                    raise ValueError("bad batch")
+                for item, future in batch:
+                    future.set_result(item.upper())
+        
+        async def run():
+            batcher = FlakyBatcher(max_batch=4, max_wait=0.01)
+            first = await asyncio.gather(batcher._submit("bad"), return_exceptions=True)
+            second = await asyncio.wait_for(batcher._submit("ok"), 2)
+            return first, second
+        
+        first, second = asyncio.run(run())
+        
+        assert isinstance(first[0], ValueError)
+        assert second == "OK"
+
+
 # =============================================================================
 # ERROR HANDLING TESTS
 # =============================================================================
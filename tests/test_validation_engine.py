@@ -496,6 +496,83 @@ class TestReportGeneration:
         assert "UX-Master" in html
 
 
+    def test_markdown_output_to_file(self, validation_engine, sample_harvester_data):
+        """Test Markdown report streamed to a file matches the returned string."""
+        import io
+        from validation_engine import generate_markdown_report
+        
+        report = validation_engine.validate(sample_harvester_data, test_suite="all")
+        buffer = io.StringIO()
+        
+        assert generate_markdown_report(report, out=buffer) is None
+        assert buffer.getvalue() == generate_markdown_report(report)
+    
+    def test_html_output_to_file(self, validation_engine, sample_harvester_data):
+        """Test HTML report streamed to a file matches the returned string."""
+        import io
+        from validation_engine import generate_html_report
+        
+        report = validation_engine.validate(sample_harvester_data, test_suite="all")
+        buffer = io.StringIO()
+        
+        assert generate_html_report(report, out=buffer) is None
+        assert buffer.getvalue() == generate_html_report(report)
+
+
+# =============================================================================
+# CACHING AND STREAMING TESTS
+# =============================================================================
+
+class TestValidateCached:
+    """Test report caching by input content."""
+    
+    def test_repeated_call_returns_same_report(self, validation_engine, sample_harvester_data):
+        """Test identical input reuses the cached report."""
+        first = validation_engine.validate_cached(sample_harvester_data)
+        second = validation_engine.validate_cached(json.loads(json.dumps(sample_harvester_data)))
+        
+        assert second is first
+        assert first.to_dict() == validation_engine.validate(sample_harvester_data).to_dict()
+    
+    def test_suite_is_part_of_key(self, validation_engine, sample_harvester_data):
+        """Test different suites are cached separately."""
+        full = validation_engine.validate_cached(sample_harvester_data, test_suite="all")
+        mobile = validation_engine.validate_cached(sample_harvester_data, test_suite="mobile")
+        
+        assert mobile is not full
+        assert mobile.total_count < full.total_count
+    
+    def test_register_clears_cache(self, validation_engine, sample_harvester_data):
+        """Test registering a test invalidates cached reports."""
+        from validation_engine import GenericTest
+        
+        first = validation_engine.validate_cached(sample_harvester_data)
+        validation_engine._register(GenericTest(
+            "TEST-EXTRA", "Extra", TestCategory.ACCESSIBILITY, TestSeverity.LOW, ""
+        ))
+        second = validation_engine.validate_cached(sample_harvester_data)
+        
+        assert second is not first
+        assert second.total_count == first.total_count + 1
+
+
+class TestStreamingValidation:
+    """Test incremental validation."""
+    
+    def test_iter_validate_matches_validate(self, validation_engine, sample_harvester_data):
+        """Test a report built from streamed results equals validate()."""
+        streamed = validation_engine.build_report(list(validation_engine.iter_validate(sample_harvester_data)))
+        direct = validation_engine.validate(sample_harvester_data)
+        
+        assert streamed.to_dict() == direct.to_dict()
+    
+    def test_iter_validate_suite(self, validation_engine, sample_harvester_data):
+        """Test streamed results follow the compiled suite."""
+        results = list(validation_engine.iter_validate(sample_harvester_data, test_suite="mobile"))
+        
+        assert [r.test_id for r in results] == [t.test_id for t in validation_engine.compile_suite("mobile")]
+
+
 # =============================================================================
 # EDGE CASE TESTS
 # =============================================================================